@@ -1,13 +1,42 @@
 from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 User = get_user_model()
 
 
+class EstimatedPaginator(Paginator):
+    """
+    Paginator that reads the planner's row estimate instead of running
+    COUNT(*) over the whole table. Only used on PostgreSQL for unfiltered
+    querysets; anything else falls back to the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        query = self.object_list.query
+        connection = connections[self.object_list.db]
+        if connection.vendor != "postgresql" or query.where:
+            return super().count
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::BIGINT FROM pg_class WHERE relname = %s",
+                [query.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if not row or row[0] < 0:  # table never analyzed
+            return super().count
+        return row[0]
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
 
+    paginator = EstimatedPaginator
+    show_full_result_count = False
     list_editable = ("step",)
     list_display_links = ("id", "user_id")
     list_filter = ("is_staff", "is_send_ads")
@@ -16,7 +45,7 @@ class UserAdmin(BaseUserAdmin):
         "user_id",
         "step"
     )
-    search_fields = ("first_name", "username", "user_id")
+    search_fields = ("^username", "=user_id")
     ordering = ("id", )
     fieldsets = (
         (None, {"fields": ("password", "user_id")}),
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2025-10-16 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_user_subscription_expires_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='step',
+            field=models.CharField(db_index=True, default='home', max_length=30, verbose_name='current step'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='subscription_expires_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
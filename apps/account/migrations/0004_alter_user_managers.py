@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2025-10-16 11:48
+
+import apps.account.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_alter_user_step_alter_user_subscription_expires_at'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', apps.account.models.UserManager()),
+            ],
+        ),
+    ]
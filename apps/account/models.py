@@ -1,40 +1,64 @@
 from datetime import timedelta
 
 from django.contrib.auth.models import AbstractUser
-from django.db import models, transaction
+from django.contrib.auth.models import UserManager as BaseUserManager
+from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Now
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 
+class UserManager(BaseUserManager):
+
+    def active_subscribers(self):
+        """Users whose subscription has not expired yet, filtered in the database."""
+        return self.filter(subscription_expires_at__gt=Now())
+
+
 class User(AbstractUser):
 
     user_id = models.BigIntegerField(unique=True,verbose_name=_("user id"))
 
-    step = models.CharField(max_length=30,default="home",verbose_name=_("current step"))
+    step = models.CharField(max_length=30,default="home",db_index=True,verbose_name=_("current step"))
 
     is_send_ads = models.BooleanField(default=False,verbose_name=_("Advertising status"))
 
-    subscription_expires_at = models.DateTimeField(null=True, blank=True)
+    subscription_expires_at = models.DateTimeField(null=True, blank=True, db_index=True)
 
     USERNAME_FIELD = "username"
     REQUIRED_FIELDS = ["user_id"]
 
-    def has_active_subscription(self) -> bool:
+    objects = UserManager()
+
+    @cached_property
+    def _active_subscription(self) -> bool:
         # consider MAX_DATE as unlimited so still active
         if not self.subscription_expires_at:
             return False
         return self.subscription_expires_at > timezone.now()
 
-    @transaction.atomic
+    def has_active_subscription(self) -> bool:
+        return self._active_subscription
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop("_active_subscription", None)
+        super().refresh_from_db(*args, **kwargs)
+
     def add_subscription(self, days: int):
+        now = timezone.now()
         if days < 0:
-            self.subscription_expires_at = timezone.now() + timedelta(days=365000)  # unlimited
+            new_expires_at = Value(now + timedelta(days=365000))  # unlimited
         else:
-            if self.subscription_expires_at and self.subscription_expires_at > timezone.now():
-                self.subscription_expires_at += timedelta(days=days)
-            else:
-                self.subscription_expires_at = timezone.now() + timedelta(days=days)
-        self.save(update_fields=["subscription_expires_at"])
+            delta = timedelta(days=days)
+            # extend an active subscription in SQL so concurrent purchases stack correctly
+            new_expires_at = Case(
+                When(subscription_expires_at__gt=now, then=F("subscription_expires_at") + delta),
+                default=Value(now + delta),
+            )
+        User.objects.filter(pk=self.pk).update(subscription_expires_at=new_expires_at)
+        self.refresh_from_db(fields=["subscription_expires_at"])
 
     def subscription_info(self) -> str:
         """
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models.functions import Substr
 
 from apps.bot.models import BotUpdateStatus, ChannelSponsor, Episode, Message, Plan, Session
 
@@ -8,16 +9,23 @@ class BotUpdateStatusAdmin(admin.ModelAdmin):
     list_display = ("id", "is_update", "text")
     list_editable = ("is_update", )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer("update_msg").annotate(update_msg_preview=Substr("update_msg", 1, 30))
+
     def text(self, obj):
-        return obj.update_msg[:30]
+        return obj.update_msg_preview
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "_text")
     search_fields = ("name", )
 
+    def get_queryset(self, request):
+        # only the first 30 chars are shown, don't pull the whole text column
+        return super().get_queryset(request).defer("text").annotate(text_preview=Substr("text", 1, 30))
+
     def _text(self, obj):
-        return obj.text[:30]
+        return obj.text_preview
 
 @admin.register(ChannelSponsor)
 class ChannelSponsorAdmin(admin.ModelAdmin):
@@ -25,8 +33,11 @@ class ChannelSponsorAdmin(admin.ModelAdmin):
     search_fields = ("name", )
     list_editable = ("name", "other")
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(link_preview=Substr("link", 1, 30))
+
     def _link(self, obj):
-        return obj.link[:30]
+        return obj.link_preview
 
 @admin.register(Plan)
 class PlanAdmin(admin.ModelAdmin):
@@ -37,6 +48,7 @@ class PlanAdmin(admin.ModelAdmin):
 @admin.register(Episode)
 class EpisodeAdmin(admin.ModelAdmin):
     list_display = ("id", "session", "message_id", "order")
+    list_select_related = ("session",)
     search_fields = ("message_id",)
 
 @admin.register(Session)
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2025-10-16 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0007_remove_episode_title_alter_episode_message_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='episode',
+            index=models.Index(fields=['session', 'order'], name='episode_session_order_idx'),
+        ),
+    ]
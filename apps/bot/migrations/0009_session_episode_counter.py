@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2025-10-16 10:40
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def fill_episode_counter(apps, schema_editor):
+    Session = apps.get_model('bot', 'Session')
+    for session in Session.objects.annotate(last_order=Max('episodes__order')):
+        if session.last_order:
+            Session.objects.filter(pk=session.pk).update(episode_counter=session.last_order)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot', '0008_episode_session_order_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='session',
+            name='episode_counter',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_episode_counter, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,19 @@
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from utils.load_env import env
 from utils.utils import generate_unique_link
 
+_LINK_PREFIX = f"https://t.me/{env.BOT_USERNAME}/?start="
+
 
 class BotUpdateStatus(models.Model):
+    CACHE_KEY = "bot_update_status"
+    CACHE_TIMEOUT = 30  # seconds; bounds staleness for processes that did not run save()
+
     is_update = models.BooleanField(
         default=False
     )
@@ -12,7 +21,25 @@ class BotUpdateStatus(models.Model):
 
     def save(self, *args, **kwargs):
         self.id = 1
-        return super().save(*args, **kwargs)
+        result = super().save(*args, **kwargs)
+        cache.set(self.CACHE_KEY, {"is_update": self.is_update, "update_msg": self.update_msg}, self.CACHE_TIMEOUT)
+        return result
+
+    @classmethod
+    def current(cls) -> dict:
+        """
+        Return the bot status as {"is_update": ..., "update_msg": ...},
+        served from the cache and loaded from the database only on a miss.
+        """
+        status = cache.get(cls.CACHE_KEY)
+        if status is None:
+            obj = cls.objects.filter(pk=1).first()
+            status = {
+                "is_update": obj.is_update if obj else False,
+                "update_msg": obj.update_msg if obj else "",
+            }
+            cache.set(cls.CACHE_KEY, status, cls.CACHE_TIMEOUT)
+        return status
 
     def __str__(self):
         return str(f"Bot status is: {self.is_update}")
@@ -26,7 +53,19 @@ class Message(models.Model):
     def __str__(self) -> str:
         return f"{self.name}"
 
+@receiver(post_delete, sender=BotUpdateStatus)
+def clear_bot_update_status_cache(sender, **kwargs):
+    cache.delete(BotUpdateStatus.CACHE_KEY)
+
+@receiver([post_save, post_delete], sender=Message)
+def clear_message_cache(sender, **kwargs):
+    """Drop cached message texts so admin edits are picked up immediately."""
+    from apps.common._message import MessageManager
+    MessageManager.MESSAGES.clear()
+
 class ChannelSponsor(models.Model):
+    CACHE_KEY = "channel_sponsors"
+    CACHE_TIMEOUT = 300  # seconds; bounds staleness for processes that did not save the change
 
     name = models.CharField(max_length=70,null=True,blank=True)
 
@@ -39,10 +78,21 @@ class ChannelSponsor(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def cached_all(cls) -> list:
+        """
+        Return every sponsor channel, served from the cache
+        and loaded from the database only on a miss.
+        """
+        return cache.get_or_set(cls.CACHE_KEY, lambda: list(cls.objects.all()), cls.CACHE_TIMEOUT)
+
 class Plan(models.Model):
     """
     Subscription or service plan.
     """
+    KEYBOARD_CACHE_KEY = "pay_plan_keyboard"
+    CACHE_TIMEOUT = 300  # seconds; bounds staleness for processes that did not save the change
+
     name = models.CharField(max_length=100)
     price_rial = models.PositiveBigIntegerField()
     duration_days = models.IntegerField(
@@ -59,6 +109,14 @@ class Plan(models.Model):
             return f"{self.name} - Unlimited"
         return f"{self.name} - {self.duration_days} days"
 
+@receiver([post_save, post_delete], sender=ChannelSponsor)
+def clear_channel_sponsor_cache(sender, **kwargs):
+    cache.delete(ChannelSponsor.CACHE_KEY)
+
+@receiver([post_save, post_delete], sender=Plan)
+def clear_pay_plan_keyboard_cache(sender, **kwargs):
+    cache.delete(Plan.KEYBOARD_CACHE_KEY)
+
 class Session(models.Model):
     """
     Represents a movie or a series (as a whole).
@@ -74,13 +132,14 @@ class Session(models.Model):
     view_count = models.PositiveIntegerField(default=0)  # total views
     like_count = models.PositiveIntegerField(default=0)
     dislike_count = models.PositiveIntegerField(default=0)
+    episode_counter = models.PositiveIntegerField(default=0)  # last order handed out to an episode
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"{self.title} ({self.content_type})"
 
     def get_link(self):
-        return f"https://t.me/{env.BOT_USERNAME}/?start={self.link}"
+        return _LINK_PREFIX + self.link
 
     def save(self, *args, **kwargs):
         if not self.link:
@@ -101,25 +160,28 @@ class Episode(models.Model):
         if self._state.adding: # just if added new records
             if not self.link:
                 self.link = generate_unique_link("E")
-            self.order = self.calc_order(self.session.id)
+            with transaction.atomic():
+                self.order = self.calc_order(self.session_id)
+                return super().save(*args, **kwargs)
         super().save(*args, **kwargs)
 
     @staticmethod
     def calc_order(session_id):
-        present_orders = (
-            Episode.objects.filter(session_id=session_id)
-            .order_by("-order")
-            .values_list("order", flat=True)
-        )
-        if present_orders:
-            return present_orders[0] + 1
-        return 1
+        """
+        Reserve the next episode order of the session.
+        The counter is bumped in SQL so concurrent uploads never get the same order.
+        """
+        Session.objects.filter(pk=session_id).update(episode_counter=F("episode_counter") + 1)
+        return Session.objects.values_list("episode_counter", flat=True).get(pk=session_id)
 
     class Meta:
         ordering = ["order"]
+        indexes = [
+            models.Index(fields=["session", "order"], name="episode_session_order_idx"),
+        ]
 
     def __str__(self):
         return f"{self.order} (Episode of {self.session.title})"
 
     def get_link(self):
-        return f"https://t.me/{env.BOT_USERNAME}/?start={self.link}"
+        return _LINK_PREFIX + self.link
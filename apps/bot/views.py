@@ -1,4 +1,5 @@
 import json
+import logging
 import traceback
 
 from rest_framework import status
@@ -37,9 +38,12 @@ class TelegramWebhookView(APIView):
         """
         try:
             update_dict = request.data
-            logger.info("Received Telegram update:\n%s", json.dumps(update_dict, indent=4, ensure_ascii=False))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received Telegram update:\n%s", json.dumps(update_dict, ensure_ascii=False))
+            else:
+                logger.info("Received Telegram update: update_id=%s", update_dict.get("update_id"))
 
-            update = Update(**update_dict)
+            update = Update.model_validate(update_dict)
             Dispatcher(update).dispatch()
 
         except Exception:
@@ -6,10 +6,10 @@ class MessageManager:
     Manages retrieval and formatting of messages from the database.
     """
 
-    MESSAGES = {}
+    MESSAGES = {}  # name -> text, cleared whenever a Message row changes
 
-    @staticmethod
-    def get_message(name: str, **kwargs) -> str:
+    @classmethod
+    def get_message(cls, name: str, **kwargs) -> str:
         """
         Retrieves a message from the database and formats it if needed.
 
@@ -25,6 +25,10 @@ class MessageManager:
             >>> MessageManager.fetch("welcome", username="Ali")
             "Hello Ali! Welcome."
         """
-        message = Message.objects.get(name=name.strip())
-        text = message.text
+        key = name.strip()
+        if key in cls.MESSAGES:
+            text = cls.MESSAGES[key]
+        else:
+            text = Message.objects.values_list("text", flat=True).get(name=key)
+            cls.MESSAGES[key] = text
         return text.format(**kwargs) if kwargs else text
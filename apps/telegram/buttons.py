@@ -0,0 +1,28 @@
+"""
+Reply-keyboard button labels.
+
+The keyboards in `keyboard.py` and the message handlers that react to the
+pressed button both read these, so a label is only ever written once.
+"""
+
+# home keyboard
+BTN_ACCOUNT_INFO = "اطلاعات حساب 👤"
+BTN_BUY_SUBSCRIPTION = "🛒 خرید اشتراک"
+BTN_GIFT_SUBSCRIPTION = "گیفت اشتراک به دوستان 🎁"
+BTN_SUPPORT = "💌 حمایت از مجموعه"
+
+# admin home keyboard
+BTN_BROADCAST = "پیام همگانی 📡"
+BTN_UPLOAD = "اپلود ⬇️"
+BTN_EDIT = "ویرایش ⚙️"
+BTN_USER_INFO = "اطلاعات کاربر 💹"
+
+# admin upload keyboard
+BTN_UPLOAD_SERIES = "اپلود سریال ➕"
+BTN_UPLOAD_MOVIE = "اپلود فیلم ➕"
+
+# cancel keyboard
+BTN_CANCEL_UPLOAD = "لغو اپلود ❌"
+BTN_FINISH_UPLOAD = "اتمام اپلود ✅"
+
+BTN_BACK = "بازگشت"
@@ -1,33 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
+from django.core.cache import cache
+
 from apps.bot.models import ChannelSponsor
 
 
+SPONSOR_CACHE_TIMEOUT = 60
+
+# shared by every sponsor-gated update; kept apart from the handlers' background pool
+# so a gated handler running there can never wait on its own pool
+_MEMBERSHIP_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+
+def _sponsor_key(user_id, channel_chat_id):
+    return f"sponsor:{user_id}:{channel_chat_id}"
+
+
+def is_member(bot, channel_chat_id, user_id) -> bool:
+    """
+    Membership check backed by the cache.
+    Only positive answers are cached: a user who has not joined yet is
+    re-checked every time, so pressing "joined" is seen immediately.
+    """
+    key = _sponsor_key(user_id, channel_chat_id)
+    if cache.get(key):
+        return True
+    joined = bot.is_join_channel(channel_chat_id, user_id)
+    if joined:
+        cache.set(key, True, SPONSOR_CACHE_TIMEOUT)
+    return joined
+
 def channel_sponsor(self):
-    channels = ChannelSponsor.objects.all()
-    try:
-        msg = self.bot_messages.get_message("sponsor_channels_message")
-    except Exception:
-        msg = "please join in the sponsor channel"
-    if channels:
-        not_join_channel_chat_id = []
-        for channel in channels:
-            if channel.other:
-                continue
-            if self.bot.is_join_channel(channel.chat_id, self.chat_id):
-                continue
-            else:
-                not_join_channel_chat_id.append(channel.chat_id)
-
-        if not_join_channel_chat_id:
-            channels = channels.filter(chat_id__in=not_join_channel_chat_id)
-            self.bot.send_message(
-                chat_id=self.chat_id,
-                text=msg,
-                parse_mode="html",
-                reply_markup=self.inline_keyboard.sponsor_channel_keyboard(channels)
-            )
-            return True
+    channels = ChannelSponsor.cached_all()
+    chat_ids = [channel.chat_id for channel in channels if not channel.other]
+    if not chat_ids:
+        return False
+
+    keys = {chat_id: _sponsor_key(self.chat_id, chat_id) for chat_id in chat_ids}
+    cached = cache.get_many(list(keys.values()))
+    to_check = [chat_id for chat_id in chat_ids if not cached.get(keys[chat_id])]
+
+    def check(chat_id):
+        return is_member(self.bot, chat_id, self.chat_id)
+
+    # membership checks are independent Telegram calls; only fan out when several are needed
+    if len(to_check) > 1:
+        results = list(_MEMBERSHIP_EXECUTOR.map(check, to_check))
+    else:
+        results = [check(chat_id) for chat_id in to_check]
+    not_join_channel_chat_id = [chat_id for chat_id, joined in zip(to_check, results) if not joined]
+
+    if not_join_channel_chat_id:
+        try:
+            msg = self.bot_messages.get_message("sponsor_channels_message")
+        except Exception:
+            msg = "please join in the sponsor channel"
+        not_joined = set(not_join_channel_chat_id)
+        channels = [channel for channel in channels if channel.chat_id in not_joined]
+        self.bot.send_message(
+            chat_id=self.chat_id,
+            text=msg,
+            parse_mode="html",
+            reply_markup=self.inline_keyboard.sponsor_channel_keyboard(channels)
+        )
+        return True
     return False
 
 def sponsor_required(func):
@@ -2,6 +2,8 @@ from apps.telegram.handlers import CallBackQueryHandler, CommandHandler, MediaHa
 from apps.telegram.telegram import Telegram
 from apps.telegram.telegram_models import Update
 
+_MEDIA_ATTRS = ("photo", "audio", "video", "voice", "document", "sticker")
+
 
 class Dispatcher:
     """
@@ -25,7 +27,7 @@ class Dispatcher:
 
     def __init__(self, update: Update, bot: Telegram = None):
         self.update = update
-        self.bot = bot or Telegram()
+        self.bot = bot or Telegram.shared()
 
     def dispatch(self):
 
@@ -33,14 +35,7 @@ class Dispatcher:
             if self.update.message.text and self.update.message.text.startswith("/"):
                 return CommandHandler(update=self.update, bot=self.bot).handle()
 
-            elif any([
-                self.update.message.photo,
-                self.update.message.audio,
-                self.update.message.video,
-                self.update.message.voice,
-                self.update.message.document,
-                self.update.message.sticker
-            ]):
+            elif any(getattr(self.update.message, attr, None) for attr in _MEDIA_ATTRS):
                 return MediaHandler(update=self.update, bot=self.bot).handle()
 
             return MessageHandler(update=self.update, bot=self.bot).handle()
@@ -1,6 +1,7 @@
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from django.db import close_old_connections
 from django.utils.functional import cached_property
 
 from apps.account.models import User as UserDB
@@ -8,6 +9,24 @@ from apps.common._message import MessageManager
 from apps.telegram.keyboard import InlineKeyboardMarkup, ReplyKeyboardMarkup
 from apps.telegram.telegram import Telegram
 from apps.telegram.telegram_models import Chat, Update, User
+from utils.load_env import env
+from utils.logger import logger
+
+_BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=int(env.get("BACKGROUND_WORKERS", 16)))
+
+
+def _run_background_task(func, *args, **kwargs):
+    """
+    Pool workers live for the whole process, so drop stale DB connections around each task
+    the way Django does around a request, and log failures nobody else will see.
+    """
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", getattr(func, "__qualname__", func))
+    finally:
+        close_old_connections()
 
 
 class BaseHandler:
@@ -16,6 +35,9 @@ class BaseHandler:
     such as accessing user, chat, and message details.
     """
 
+    # columns the handlers read from user_obj on every update
+    USER_FIELDS = ("id", "user_id", "step", "is_active", "is_superuser", "subscription_expires_at")
+
     def __init__(self, update: Update, bot: Telegram):
         """
         Initializes the handler with the incoming update and bot instance.
@@ -26,36 +48,36 @@ class BaseHandler:
         self.inline_keyboard = InlineKeyboardMarkup()
         self.bot_messages = MessageManager()
 
+        # resolve which part of the update carries the message/sender once,
+        # so the properties below don't walk the update on every access
+        message = update.message
+        callback_query = update.callback_query
+        self._kind = "message" if message else "callback" if callback_query else "inline" if update.inline_query else None
+        self._msg = message or (callback_query.message if callback_query else None)
+        source = message or callback_query or update.inline_query
+        self._from = source.from_user if source else None
+        self._chat = self._msg.chat if self._msg else None
+
     @property
     def chat(self) -> Optional[Chat]:
         """
         Returns the chat object from the update, if available.
         """
-        if self.update.message:
-            return self.update.message.chat
-        if self.update.callback_query:
-            return self.update.callback_query.message.chat
-        return None
+        return self._chat
 
     @property
     def user(self) -> Optional[User]:
         """
         Returns the user object who sent the update, if available.
         """
-        if self.update.message:
-            return self.update.message.from_user
-        if self.update.callback_query:
-            return self.update.callback_query.from_user
-        if self.update.inline_query:
-            return self.update.inline_query.from_user
-        return None
+        return self._from
 
     @property
     def chat_id(self) -> Optional[int]:
         """
         Returns the chat ID, if the chat exists.
         """
-        return self.chat.id if self.chat else None
+        return self._chat.id if self._chat else None
 
     @cached_property
     def user_obj(self) -> Optional[UserDB]:
@@ -63,6 +85,10 @@ class BaseHandler:
             return None
         if not self.is_private():
             return None
+        user = UserDB.objects.filter(user_id=self.user_id).only(*self.USER_FIELDS).first()
+        if user is not None:
+            return user
+        # first contact: get_or_create still covers two updates racing to create the row
         user, _ = UserDB.objects.get_or_create(
             user_id=self.user_id,
             defaults={
@@ -86,70 +112,63 @@ class BaseHandler:
         """
         Returns the Telegram user ID, if available.
         """
-        return self.user.id if self.user else None
+        return self._from.id if self._from else None
 
     @property
     def text(self) -> str:
         """
         Checks whether the update is a text message.
         """
-        if self.update.message:
-            return self.update.message.text
-        if self.update.callback_query:
-            return self.update.callback_query.message.text
-
-        return None
+        return self._msg.text if self._msg else None
 
     def is_text(self) -> bool:
         """
         Checks whether the update is a text message.
         """
-        return bool(self.update.message and self.update.message.text)
+        return bool(self._kind == "message" and self._msg.text)
 
     def is_command(self) -> bool:
         """
         Checks whether the message is a command (starts with "/").
         """
-        return bool(self.update.message and self.update.message.text and self.update.message.text.startswith("/"))
+        return bool(self._kind == "message" and self._msg.text and self._msg.text.startswith("/"))
 
     def is_photo(self) -> bool:
         """
         Checks whether the message contains a photo.
         """
-        return bool(self.update.message and self.update.message.photo)
+        return bool(self._kind == "message" and self._msg.photo)
 
     def is_private(self) -> bool:
         """
         Checks whether the message contains a private chat.
         """
-        if self.chat:
-            return self.chat.type == "private"
+        if self._chat:
+            return self._chat.type == "private"
         return None
 
     def is_group(self) -> bool:
         """
         Checks whether the message contains a group chat.
         """
-        if self.chat:
-            return self.chat.type in ["supergroup", "group"]
+        if self._chat:
+            return self._chat.type in ("supergroup", "group")
         return None
 
     def run_function_in_thread(self, func, *args, **kwargs):
         """
-            Run the given function in a separate thread.
+            Run the given function on the shared background thread pool.
         """
-        thread = threading.Thread(target=func, args=args, kwargs=kwargs)
-        thread.start()
-        return thread
+        return _BACKGROUND_EXECUTOR.submit(_run_background_task, func, *args, **kwargs)
 
     def is_update_mode(self):
         """Check if the application is currently in update mode."""
         from apps.bot.models import BotUpdateStatus
-        update_obj = BotUpdateStatus.objects.first()
-        if update_obj.is_update and not self.user_obj.is_superuser:
+        status = BotUpdateStatus.current()
+        if status["is_update"] and not self.user_obj.is_superuser:
             return self.bot.send_message(
                 self.chat_id,
-                text=update_obj.update_msg,
+                text=status["update_msg"],
                 parse_mode="html"
             )
         return False
@@ -163,3 +182,10 @@ class BaseHandler:
                 parse_mode="html"
             )
         return False
+
+    def _preflight(self):
+        """
+            Run the guards every handle() starts with.
+            The in-memory block check goes first so blocked users never reach the update status lookup.
+        """
+        return self.is_user_block() or self.is_update_mode()
@@ -1,34 +1,57 @@
+import re
+
+from django.db import transaction
+from django.db.models import Count
+
 from apps.bot.models import Episode, Plan, Session
 from apps.telegram.decorator import sponsor_required
 from apps.telegram.handlers.base_handlers import BaseHandler
 from apps.telegram.telegram import Telegram
 from apps.telegram.telegram_models import Update
+from utils.logger import logger
 from utils.utils import update_object
 
+# "<key>[:arg[:arg[:arg]]]", e.g. "pay:3" or "sure_delete_object:yes:e:12"
+_CALLBACK_RE = re.compile(r"^([a-z_]+)(?::([^:]+))?(?::([^:]+))?(?::([^:]+))?$")
+
 
 class CallBackQueryHandler(BaseHandler):
 
+    # callback_data prefix -> handler method name, resolved with getattr on dispatch
+    _CALLBACKS = {
+        "joined_to_sponsor": "joined_channel_sponsor_handler",
+        "edit_session": "edit_session_handler",
+        "sure_delete_object": "sure_delete_object_handler",
+        "pay": "payment_plan_handler",
+    }
+
     def __init__(self, update: Update, bot: Telegram):
         super().__init__(update, bot)
 
-        self.callback_handlers = {
-            "joined_to_sponsor": self.joined_channel_sponsor_handler,
-            "edit_session": self.edit_session_handler,
-            "sure_delete_object": self.sure_delete_object_handler,
-            "pay": self.payment_plan_handler,
-        }
+        # parsed once, every callback handler below reads these
+        callback_query = update.callback_query
+        self.callback_data = callback_query.data or ""
+        match = _CALLBACK_RE.match(self.callback_data)
+        self.callback_args = match.groups() if match else ()
+
+    @property
+    def callback_message_id(self):
+        """
+        Id of the message the pressed button belongs to; None for inline-mode or inaccessible messages.
+        """
+        message = self.update.callback_query.message
+        return message.message_id if message else None
 
     @sponsor_required
-    def joined_channel_sponsor_handler(self):
-        self.bot.delete_message(chat_id=self.chat_id, message_id=self.update.callback_query.message.message_id)
+    def joined_channel_sponsor_handler(self, *_):
+        self.bot.delete_message(chat_id=self.chat_id, message_id=self.callback_message_id)
         update_object(self.user_obj, step="home")
         return self.bot.send_message(
             chat_id=self.chat_id,
             text="Home"
         )
 
-    def payment_plan_handler(self):
-        _, plan_id = self.update.callback_query.data.split(":")
+    def payment_plan_handler(self, plan_id, *_):
         plan = Plan.objects.get(id=plan_id)
 
         # self.bot.delete_message(chat_id=self.chat_id, message_id=self.update.callback_query.message.message_id)
@@ -38,17 +61,17 @@ class CallBackQueryHandler(BaseHandler):
         #     text="Home"
         # )
 
-    def edit_session_handler(self):
+    def edit_session_handler(self, operation, object_id, *_):
         """
             edit_session:delete_e:6
             edit_session:add_e:4
             edit_session:delete_s:4
         """
-        _, operation, object_id = self.update.callback_query.data.split(":")
+        message_id = self.callback_message_id
 
         handlers = {
-            "delete_e": lambda: self._confirm_delete(Episode, object_id, "e"),
-            "delete_s": lambda: self._confirm_delete(Session, object_id, "s"),
+            "delete_e": lambda: self._confirm_delete(Episode, object_id, "e", message_id),
+            "delete_s": lambda: self._confirm_delete(Session, object_id, "s", message_id),
             "add_e": lambda: self._add_episode(object_id),
         }
 
@@ -61,7 +84,7 @@ class CallBackQueryHandler(BaseHandler):
                 text="❌ عملیات ناشناخته است."
             )
 
-    def _confirm_delete(self, model, object_id, object_type):
+    def _confirm_delete(self, model, object_id, object_type, message_id):
         try:
             obj = model.objects.get(pk=object_id)
         except model.DoesNotExist:
@@ -74,7 +97,7 @@ class CallBackQueryHandler(BaseHandler):
         return self.bot.edit_message_text(
             chat_id=self.chat_id,
             text=warning_msg,
-            message_id=self.update.callback_query.message.message_id,
+            message_id=message_id,
             reply_markup=self.inline_keyboard.sure_delete_object_keyboard(obj.pk, object_type),
         )
 
@@ -96,22 +119,21 @@ class CallBackQueryHandler(BaseHandler):
     )
 
     # edit session part
-    def _build_session_info_message(self, session):
-        session.refresh_from_db()
+    def _build_session_info_message(self, session, episode_count):
         _type = "سریال" if session.content_type == "series" else "فیلم"
         return (
             "📌 *اطلاعات سشن*\n\n"
             f"🎬 *اسم سشن:* `{session.title}`\n"
-            f"📺 *تعداد قسمت‌ها:* `{session.episodes.count()}`\n"
+            f"📺 *تعداد قسمت‌ها:* `{episode_count}`\n"
             f"📂 *نوع:* `{_type}`\n"
         )
 
-    def _cancel_delete(self, session):
-        msg = self._build_session_info_message(session)
+    def _cancel_delete(self, session, message_id):
+        msg = self._build_session_info_message(session, session.episodes.count())
         return self.bot.edit_message_text(
             chat_id=self.chat_id,
             text=msg,
-            message_id=self.update.callback_query.message.message_id,
+            message_id=message_id,
             reply_markup=self.inline_keyboard.edit_session_keyboard(session),
             parse_mode="markdown",
         )
@@ -121,14 +143,16 @@ class CallBackQueryHandler(BaseHandler):
             if object_type == "s":
                 return Session.objects.get(pk=object_id)
             elif object_type == "e":
-                episode = Episode.objects.get(pk=object_id)
+                episode = Episode.objects.select_related("session").get(pk=object_id)
                 return episode.session
         except (Session.DoesNotExist, Episode.DoesNotExist):
             return None
 
     def _delete_session(self, session):
-        update_object(self.user_obj, step="admin_home")
-        session.delete()
+        with transaction.atomic():
+            update_object(self.user_obj, step="admin_home")
+            # Episode has no delete signals, so the collector removes them in one bulk DELETE
+            Session.objects.filter(pk=session.pk).delete()
         return self.bot.send_message(
             chat_id=self.chat_id,
             text="✅ سشن مورد نظر حذف شد.",
@@ -136,20 +160,19 @@ class CallBackQueryHandler(BaseHandler):
             parse_mode="markdown",
         )
 
-    def _delete_episode(self, session, episode_id):
+    def _delete_episode(self, session, episode_id, message_id):
         Episode.objects.filter(pk=episode_id).delete()
-        msg = self._build_session_info_message(session)
-        session.refresh_from_db()
+        session = Session.objects.annotate(episode_count=Count("episodes")).get(pk=session.pk)
+        msg = self._build_session_info_message(session, session.episode_count)
         return self.bot.edit_message_text(
             chat_id=self.chat_id,
             text=msg,
-            message_id=self.update.callback_query.message.message_id,
+            message_id=message_id,
             reply_markup=self.inline_keyboard.edit_session_keyboard(session),
             parse_mode="markdown",
         )
 
-    def sure_delete_object_handler(self):
-        _, operation, object_type, object_id = self.update.callback_query.data.split(":")
+    def sure_delete_object_handler(self, operation, object_type, object_id):
 
         session = self._get_session(object_type, object_id)
         if not session:
@@ -158,24 +181,24 @@ class CallBackQueryHandler(BaseHandler):
                 text="❌ سشن یا اپیزود مورد نظر پیدا نشد.",
             )
         if operation == "no":
-            return self._cancel_delete(session)
+            return self._cancel_delete(session, self.callback_message_id)
 
         if object_type == "s":
             return self._delete_session(session)
 
         if object_type == "e":
-            return self._delete_episode(session, object_id)
+            return self._delete_episode(session, object_id, self.callback_message_id)
 
     def handle(self):
-        print("CallBackQueryHandler Handlers")
+        logger.debug("CallBackQueryHandler Handlers")
         # check update bot
-        if self.is_update_mode():return  # noqa: E701
-        if self.is_user_block():return  # noqa: E701
+        if self._preflight():return  # noqa: E701
 
 
-        callback_data = self.update.callback_query.data or ""
-        base_key = callback_data.split(":", 1)[0] # callback_data is "check_joined_channel_sponsor" or "check_joined_channel_sponsor:user_id"
+        if not self.callback_args:
+            return
 
-        handler = self.callback_handlers.get(base_key)
-        if handler:
-            return handler()
+        base_key, *args = self.callback_args # callback_data is "check_joined_channel_sponsor" or "check_joined_channel_sponsor:user_id"
+
+        if name := self._CALLBACKS.get(base_key):
+            return getattr(self, name)(*args)
@@ -1,17 +1,47 @@
-import time
+import threading
 
-from apps.bot.models import Episode, Session
+from apps.bot.models import Episode
 from apps.telegram._types import ReplyParameters
 from apps.telegram.decorator import sponsor_required
 from apps.telegram.handlers.base_handlers import BaseHandler
 from apps.telegram.telegram import Telegram
 from apps.telegram.telegram_models import Update
 from utils.load_env import env
+from utils.logger import logger
 from utils.utils import update_object
 
+# env is read once at startup, so resolve the values the handlers use per update here
+_CHANNEL_ID = env.CHANNEL_ID
+_FREE_DOWNLOAD = env.FREE_DOWNLOAD
+_AUTO_DELETE_FILE_SECOND = int(env.AUTO_DELETE_FILE_SECOND or 0)
+
+
+def _increasing_runs(message_ids, limit=100):
+    """
+    Split message ids into the batches copyMessages accepts: strictly increasing, at most `limit` long.
+    The batches keep the given order, so episodes still arrive in episode order.
+    Ids that were never stored (None) are skipped.
+    """
+    runs = []
+    for message_id in message_ids:
+        if message_id is None:
+            continue
+        if runs and len(runs[-1]) < limit and message_id > runs[-1][-1]:
+            runs[-1].append(message_id)
+        else:
+            runs.append([message_id])
+    return runs
+
 
 class CommandHandler(BaseHandler):
 
+    # command name (without "/" and "@botname") -> dispatch method name, called with the command argument
+    _COMMANDS = {
+        "start": "_start_dispatch",
+        "help": "_help_dispatch",
+        "admin": "_admin_dispatch",
+    }
+
     def __init__(self, update: Update, bot: Telegram):
         super().__init__(update, bot)
         self.bot = bot
@@ -52,66 +82,78 @@ class CommandHandler(BaseHandler):
             )
         )
 
+    def _start_dispatch(self, arg: str):
+        if not arg:
+            return self.start_handler()
+
+        if self.user_obj.has_active_subscription() or _FREE_DOWNLOAD:
+            return self.run_function_in_thread(self.send_file_to_user_handler)
+
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.inline_keyboard.pay_plan_keyboard(),
+            parse_mode="markdown"
+        )
+
+    def _admin_dispatch(self, arg: str):
+        if self.user_obj.is_superuser:
+            return self.admin_handler()
+
+    def _help_dispatch(self, arg: str):
+        return self.help_handler()
+
     def help_handler(self):
         return self.bot.send_message(chat_id=self.chat_id, text="Help Command")
 
     def send_file_to_user_handler(self):
-        def send_message(message_id: int):
-            result = self.bot.copy_message(
-                chat_id=self.chat_id,
-                from_chat_id=env.CHANNEL_ID,
-                message_id=message_id
-            )
-            if env.AUTO_DELETE_FILE_SECOND:
-                sleep_second = int(env.AUTO_DELETE_FILE_SECOND)
-                time.sleep(sleep_second)
-                self.bot.delete_message(chat_id=self.chat_id, message_id=result['result']['message_id'])
-            return
-
         _, link = self.text.split(" ")
+        message_ids = []
         if link.startswith("S_"):
-            session = Session.objects.prefetch_related("episodes").get(link=link)
-            for e in session.episodes.order_by("order"):
-                self.run_function_in_thread(send_message, e.message_id)
+            message_ids = list(
+                Episode.objects.filter(session__link=link).order_by("order").values_list("message_id", flat=True)
+            )
 
         elif link.startswith("E_"):
-            episode = Episode.objects.get(link=link)
-            self.run_function_in_thread(send_message, episode.message_id)
-        time.sleep(2)
-        if env.AUTO_DELETE_FILE_SECOND:
-            return self.bot.send_message(
+            message_ids = list(Episode.objects.filter(link=link).values_list("message_id", flat=True)[:1])
+
+        if not message_ids:
+            logger.info("No episodes found for link %s", link)
+            return
+
+        # one copyMessages call per increasing run instead of one copyMessage per episode
+        sent_message_ids = []
+        for run in _increasing_runs(message_ids):
+            result = self.bot.copy_messages(chat_id=self.chat_id, from_chat_id=_CHANNEL_ID, message_ids=run)
+            if result.get("ok"):
+                sent_message_ids.extend(item["message_id"] for item in result["result"])
+
+        if _AUTO_DELETE_FILE_SECOND and sent_message_ids:
+            self.bot.send_message(
                 chat_id=self.chat_id,
-                text=self.bot_messages.get_message("delete_file_and_save_file", time=env.AUTO_DELETE_FILE_SECOND),
+                text=self.bot_messages.get_message("delete_file_and_save_file", time=_AUTO_DELETE_FILE_SECOND),
                 reply_parameters=ReplyParameters(
                     chat_id=self.chat_id,
                     message_id=self.update.message.message_id
                 )
             )
-
-    def handle(self):
-        if self.is_update_mode():return  # noqa: E701
-        if self.is_user_block():return  # noqa: E701
-
-        if self.update.message.text.startswith("/start"):
-            if self.update.message.text == "/start":
-                self.start_handler()
-
-            elif self.update.message.text.startswith("/start "):
-
-                if self.user_obj.has_active_subscription() or env.FREE_DOWNLOAD:
-                    return self.run_function_in_thread(self.send_file_to_user_handler)
-
-                return self.bot.send_message(
-                    chat_id=self.chat_id,
-                    text=self.bot_messages.get_message("payment_plan_message"),
-                    reply_markup=self.inline_keyboard.pay_plan_keyboard(),
-                    parse_mode="markdown"
+            # deleteMessages takes at most 100 ids per call
+            for start in range(0, len(sent_message_ids), 100):
+                timer = threading.Timer(
+                    _AUTO_DELETE_FILE_SECOND,
+                    self.bot.delete_messages,
+                    kwargs={"chat_id": self.chat_id, "message_ids": sent_message_ids[start:start + 100]},
                 )
+                timer.daemon = True
+                timer.start()
 
-        elif self.update.message.text.startswith("/help"):
-            self.help_handler()
+    def handle(self):
+        if self._preflight():return  # noqa: E701
 
-        elif self.update.message.text.startswith("/admin") and self.user_obj.is_superuser:
-            self.admin_handler()
+        command, _, arg = self.update.message.text.partition(" ")
+        # "/start@botname" is how commands arrive from group chats and command menus
+        command = command[1:].partition("@")[0]
+        if name := self._COMMANDS.get(command):
+            getattr(self, name)(arg)
 
-        print("Command Handlers")
+        logger.debug("Command Handlers")
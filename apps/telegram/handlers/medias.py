@@ -3,29 +3,35 @@ from apps.telegram.handlers.base_handlers import BaseHandler
 from apps.telegram.telegram import Telegram
 from apps.telegram.telegram_models import Update
 from utils.load_env import env
+from utils.logger import logger
+from utils.utils import update_object
+
+# env is read once at startup, so resolve the values get_episode uses per upload here
+_CHANNEL_ID = env.CHANNEL_ID
+_EXTRA_CAPTION = (env.EXTRA_CAPTION or "").replace("\\n", "\n")
 
 
 class MediaHandler(BaseHandler):
 
+    # user step -> handler method name, resolved with getattr on dispatch
+    _STEPS = {
+        "get_episode": "get_episode",
+    }
+
     def __init__(self, update: Update, bot: Telegram):
         super().__init__(update, bot)
         self.update = update
         self.bot = bot
 
-        self.steps = {
-            "get_episode": self.get_episode,
-        }
-
     def get_episode(self):
-        _, session_id = self.user_obj.step.split(":")
-        session = Session.objects.get(id=session_id)
+        session_id = self._step_arg
 
         original_caption = self.update.message.caption or ""
         original_entities = self.update.message.caption_entities or []
-        if env.EXTRA_CAPTION:
-            original_caption = original_caption + env.EXTRA_CAPTION.replace("\\n", "\n")
+        if _EXTRA_CAPTION:
+            original_caption = original_caption + _EXTRA_CAPTION
             result = self.bot.copy_message(
-                chat_id=env.CHANNEL_ID,
+                chat_id=_CHANNEL_ID,
                 from_chat_id=self.chat_id,
                 message_id=self.update.message.message_id,
                 caption=original_caption,
@@ -62,10 +68,21 @@ class MediaHandler(BaseHandler):
 
         if result['ok']:
             channel_message_id = result['result']['message_id']
-            episode = Episode.objects.create(
-                session=session,
-                message_id=channel_message_id
-            )
+            try:
+                # save() and calc_order() only need the id, so the session row is not loaded
+                episode = Episode.objects.create(
+                    session_id=session_id,
+                    message_id=channel_message_id
+                )
+            except Session.DoesNotExist:
+                # the session was deleted while the file was being copied; don't leave an orphan copy behind
+                self.bot.delete_message(chat_id=_CHANNEL_ID, message_id=channel_message_id)
+                update_object(self.user_obj, step="admin_home")
+                return self.bot.send_message(
+                    chat_id=self.chat_id,
+                    text="❌ سشن پیدا نشد.",
+                    reply_markup=self.reply_keyboard.admin_home_keyboard(),
+                )
             text = (
                 f"✅ آپلود با موفقیت انجام شد!\n\n"
                 f"📌 لینک:\n [E-{episode.order}]({episode.get_link()})\n"
@@ -83,14 +100,12 @@ class MediaHandler(BaseHandler):
         )
 
     def handle(self):
-        if self.is_update_mode():return  # noqa: E701
-        if self.is_user_block():return  # noqa: E701
+        if self._preflight():return  # noqa: E701
 
-        print("Media Handlers")
+        logger.debug("Media Handlers")
         if self.user_step:
-            if callback := self.steps.get(self.user_step): # step : "home"
-                return callback()
-
-            if callback := self.steps.get(self.user_step.split(":")[0]): # step : "home:info"
-                return callback()
+            # step : "home" or "home:info", the part after ":" is kept for the step handler
+            step, _, self._step_arg = self.user_step.partition(":")
+            if name := self._STEPS.get(step):
+                return getattr(self, name)()
 
@@ -1,5 +1,20 @@
+from django.db import transaction
+from django.db.models import Prefetch
+
 from apps.account.models import User
-from apps.bot.models import Session
+from apps.bot.models import Episode, Session
+from apps.telegram.buttons import (
+    BTN_ACCOUNT_INFO,
+    BTN_BACK,
+    BTN_BUY_SUBSCRIPTION,
+    BTN_CANCEL_UPLOAD,
+    BTN_EDIT,
+    BTN_FINISH_UPLOAD,
+    BTN_UPLOAD,
+    BTN_UPLOAD_MOVIE,
+    BTN_UPLOAD_SERIES,
+    BTN_USER_INFO,
+)
 from apps.telegram.decorator import sponsor_required
 from apps.telegram.handlers.base_handlers import BaseHandler
 from apps.telegram.telegram import Telegram
@@ -9,20 +24,37 @@ from utils.utils import update_object
 
 class AdminMessageHandler(BaseHandler):
 
+    # user step -> handler method name, resolved with getattr on dispatch
+    _STEPS = {
+        "admin_home": "admin_home",
+        "admin_upload": "admin_upload",
+        "get_title": "get_title",
+        "get_episode": "get_episode",
+        "admin_user_info": "admin_user_info",
+        "admin_edit_session": "admin_edit_session",
+    }
+
+    # button text -> action method name, one map per step that reacts to reply-keyboard buttons
+    _ADMIN_HOME_ACTIONS = {
+        BTN_UPLOAD: "_goto_admin_upload",
+        BTN_USER_INFO: "_goto_user_info",
+        BTN_EDIT: "_goto_edit_session",
+    }
+    _ADMIN_UPLOAD_ACTIONS = {
+        BTN_BACK: "admin_handler",
+        BTN_UPLOAD_MOVIE: "_upload_movie",
+        BTN_UPLOAD_SERIES: "_upload_series",
+    }
+    _GET_EPISODE_ACTIONS = {
+        BTN_CANCEL_UPLOAD: "_cancel_upload",
+        BTN_FINISH_UPLOAD: "_finish_upload",
+    }
+
     def __init__(self, update: Update, bot: Telegram):
         super().__init__(update, bot)
         self.update = update
         self.bot = bot
 
-        self.steps = {
-            "admin_home": self.admin_home,
-            "admin_upload": self.admin_upload,
-            "get_title": self.get_title,
-            "get_episode": self.get_episode,
-            "admin_user_info": self.admin_user_info,
-            "admin_edit_session": self.admin_edit_session,
-        }
-
     def admin_handler(self):
         update_object(self.user_obj, step="admin_home")
         return self.bot.send_message(
@@ -32,12 +64,16 @@ class AdminMessageHandler(BaseHandler):
         )
 
     def admin_user_info(self):
-        if self.update.message.text == "بازگشت":
+        text = self.update.message.text
+        if text == BTN_BACK:
             return self.admin_handler()
         else:
+            # user_id is numeric, anything else can't match a row so skip the query
+            if not (text or "").isdigit():
+                return self.bot.send_message(chat_id=self.chat_id,text="یوزر پیدا نشد",parse_mode="markdown")
             try:
-                _user = User.objects.get(user_id=self.text)
-            except Exception:
+                _user = User.objects.only("id", "user_id", "subscription_expires_at").get(user_id=text)
+            except User.DoesNotExist:
                 return self.bot.send_message(chat_id=self.chat_id,text="یوزر پیدا نشد",parse_mode="markdown")
 
             plan_title=_user.subscription_info()
@@ -47,7 +83,7 @@ class AdminMessageHandler(BaseHandler):
                 chat_id=self.chat_id,
                 text=self.bot_messages.get_message(
                     "user_info",
-                    user_id=self.text,
+                    user_id=text,
                     plan_title=plan_title,
                     last_plan=last_plan,
                     payment_count=payment_count
@@ -57,40 +93,44 @@ class AdminMessageHandler(BaseHandler):
             )
 
     def admin_home(self):
-        if self.update.message.text == "اپلود ⬇️":
-            update_object(self.user_obj, step="admin_upload")
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text="برای اپلود سریال و یا فیلم تک قسمتی یکی رو انتخاب کن",
-                # text=self.bot_messages.get_message("payment_plan_message"),
-                reply_markup=self.reply_keyboard.admin_upload_keyboard(),
-                parse_mode="markdown"
-            )
+        if name := self._ADMIN_HOME_ACTIONS.get(self.update.message.text):
+            return getattr(self, name)()
 
-        elif self.update.message.text == "اطلاعات کاربر 💹":
-            update_object(self.user_obj, step="admin_user_info")
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text="لطفا ایدی عددی کاربر مورد نظر رو ارسال کن",
-                # text=self.bot_messages.get_message("payment_plan_message"),
-                reply_markup=self.reply_keyboard.back_keyboard(),
-                parse_mode="markdown"
-            )
+    def _goto_admin_upload(self):
+        update_object(self.user_obj, step="admin_upload")
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text="برای اپلود سریال و یا فیلم تک قسمتی یکی رو انتخاب کن",
+            # text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.reply_keyboard.admin_upload_keyboard(),
+            parse_mode="markdown"
+        )
 
-        elif self.update.message.text == "ویرایش ⚙️":
-            update_object(self.user_obj, step="admin_edit_session")
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text="لطفا لینک سشن را ارسال کنید",
-                # text=self.bot_messages.get_message("payment_plan_message"),
-                reply_markup=self.reply_keyboard.back_keyboard(),
-                parse_mode="markdown"
-            )
+    def _goto_user_info(self):
+        update_object(self.user_obj, step="admin_user_info")
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text="لطفا ایدی عددی کاربر مورد نظر رو ارسال کن",
+            # text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.reply_keyboard.back_keyboard(),
+            parse_mode="markdown"
+        )
+
+    def _goto_edit_session(self):
+        update_object(self.user_obj, step="admin_edit_session")
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text="لطفا لینک سشن را ارسال کنید",
+            # text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.reply_keyboard.back_keyboard(),
+            parse_mode="markdown"
+        )
 
     def admin_edit_session(self):
-        if self.update.message.text == "بازگشت":
+        text = self.update.message.text
+        if text == BTN_BACK:
             return self.admin_handler()
-        _, link = self.text.split("=")
+        _, link = text.split("=")
         try:
             session = Session.objects.get(link=link)
         except Exception as e:
@@ -112,30 +152,32 @@ class AdminMessageHandler(BaseHandler):
         )
 
     def admin_upload(self):
-        if self.update.message.text == "بازگشت":
-            return self.admin_handler()
+        if name := self._ADMIN_UPLOAD_ACTIONS.get(self.update.message.text):
+            return getattr(self, name)()
 
-        elif self.update.message.text == "اپلود فیلم ➕":
-            update_object(self.user_obj, step="get_title:movie")
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text="اسم فیلم را ارسال کنید",
-                # text=self.bot_messages.get_message("payment_plan_message"),
-                reply_markup=self.reply_keyboard.back_keyboard(),
-                parse_mode="markdown"
-            )
-        elif self.update.message.text == "اپلود سریال ➕":
-            update_object(self.user_obj, step="get_title:series")
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text="اسم سریال را ارسال کنید",
-                # text=self.bot_messages.get_message("payment_plan_message"),
-                reply_markup=self.reply_keyboard.back_keyboard(),
-                parse_mode="markdown"
-            )
+    def _upload_movie(self):
+        update_object(self.user_obj, step="get_title:movie")
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text="اسم فیلم را ارسال کنید",
+            # text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.reply_keyboard.back_keyboard(),
+            parse_mode="markdown"
+        )
+
+    def _upload_series(self):
+        update_object(self.user_obj, step="get_title:series")
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text="اسم سریال را ارسال کنید",
+            # text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.reply_keyboard.back_keyboard(),
+            parse_mode="markdown"
+        )
 
     def get_title(self):
-        if self.update.message.text == "بازگشت":
+        text = self.update.message.text
+        if text == BTN_BACK:
             update_object(self.user_obj, step="admin_upload")
             return self.bot.send_message(
                 chat_id=self.chat_id,
@@ -145,13 +187,15 @@ class AdminMessageHandler(BaseHandler):
                 parse_mode="markdown"
             )
 
-        _, content_type = self.user_obj.step.split(":")
+        content_type = self._step_arg
 
-        session = Session.objects.create(
-            title=self.text,
-            content_type=content_type,
-        )
-        update_object(self.user_obj, step=f"get_episode:{session.id}")
+        # the new session and the step pointing at it are committed together
+        with transaction.atomic():
+            session = Session.objects.create(
+                title=text,
+                content_type=content_type,
+            )
+            update_object(self.user_obj, step=f"get_episode:{session.id}")
         return self.bot.send_message(
             chat_id=self.chat_id,
             text="لطفا فایل مورد نظر رو ارسال کن",
@@ -161,81 +205,97 @@ class AdminMessageHandler(BaseHandler):
         )
 
     def get_episode(self):
-        _, session_id = self.user_obj.step.split(":")
-        if self.update.message.text == "لغو اپلود ❌":
-            # Session.objects.get(id=session_id).delete()
-            update_object(self.user_obj, step="admin_upload")
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text="برای اپلود سریال و یا فیلم تک قسمتی یکی رو انتخاب کن",
-                # text=self.bot_messages.get_message("payment_plan_message"),
-                reply_markup=self.reply_keyboard.admin_upload_keyboard(),
-                parse_mode="markdown"
-            )
+        session_id = self._step_arg
+        if name := self._GET_EPISODE_ACTIONS.get(self.update.message.text):
+            return getattr(self, name)(session_id)
 
-        elif self.update.message.text == "اتمام اپلود ✅":
-            update_object(self.user_obj, step="admin_home")
-            session = Session.objects.get(id=session_id)
-
-            epis = ""
-            for e in session.episodes.order_by("order"):
-                epis += f"🎬 [قسمت {e.order}]({e.get_link()})\n"
+    def _cancel_upload(self, session_id):
+        # Session.objects.get(id=session_id).delete()
+        update_object(self.user_obj, step="admin_upload")
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text="برای اپلود سریال و یا فیلم تک قسمتی یکی رو انتخاب کن",
+            # text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.reply_keyboard.admin_upload_keyboard(),
+            parse_mode="markdown"
+        )
 
-            text = (
-                "✨ *آپلود با موفقیت تکمیل شد!* ✨\n\n"
-                "📌 *لینک قسمت‌ها:*\n"
-                f"{epis}\n"
-                "📂 *لینک کل مجموعه:*\n"
-                f"🎞️ [ {session.title} ]({session.get_link()})"
+    def _finish_upload(self, session_id):
+        update_object(self.user_obj, step="admin_home")
+        # get_link only needs the link column, so the episode rows are fetched narrow in one prefetch
+        session = Session.objects.only("id", "title", "link").prefetch_related(
+            Prefetch(
+                "episodes",
+                queryset=Episode.objects.only("id", "session_id", "order", "link").order_by("order"),
+                to_attr="ordered_episodes",
             )
+        ).get(id=session_id)
 
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text=text,
-                reply_markup=self.reply_keyboard.admin_home_keyboard(),
-                parse_mode="markdown"
-            )
+        epis = "".join(f"🎬 [قسمت {e.order}]({e.get_link()})\n" for e in session.ordered_episodes)
+
+        text = (
+            "✨ *آپلود با موفقیت تکمیل شد!* ✨\n\n"
+            "📌 *لینک قسمت‌ها:*\n"
+            f"{epis}\n"
+            "📂 *لینک کل مجموعه:*\n"
+            f"🎞️ [ {session.title} ]({session.get_link()})"
+        )
+
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text=text,
+            reply_markup=self.reply_keyboard.admin_home_keyboard(),
+            parse_mode="markdown"
+        )
 
     def handle(self):
-        if self.is_update_mode():return  # noqa: E701
-        if self.is_user_block():return  # noqa: E701
+        if self._preflight():return  # noqa: E701
 
         if self.user_step:
-            if callback := self.steps.get(self.user_step): # step : "home"
-                return callback()
-
-            if callback := self.steps.get(self.user_step.split(":")[0]): # step : "home:info"
-                return callback()
+            # step : "home" or "home:info", the part after ":" is kept for the step handler
+            step, _, self._step_arg = self.user_step.partition(":")
+            if name := self._STEPS.get(step):
+                return getattr(self, name)()
 
 class MessageHandler(BaseHandler):
 
+    # user step -> handler method name, resolved with getattr on dispatch
+    _STEPS = {
+        "home": "home",
+    }
+
+    # button text -> action method name
+    _HOME_ACTIONS = {
+        BTN_BUY_SUBSCRIPTION: "_show_pay_plans",
+        BTN_ACCOUNT_INFO: "_show_account_info",
+    }
+
     def __init__(self, update: Update, bot: Telegram):
         super().__init__(update, bot)
         self.update = update
         self.bot = bot
 
-        self.steps = {
-            "home": self.home,
-        }
-
     @sponsor_required
     def home(self):
-        if self.update.message.text == "🛒 خرید اشتراک":
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text=self.bot_messages.get_message("payment_plan_message"),
-                reply_markup=self.inline_keyboard.pay_plan_keyboard(),
-                parse_mode="markdown"
-            )
+        if name := self._HOME_ACTIONS.get(self.update.message.text):
+            return getattr(self, name)()
 
-        elif self.update.message.text == "اطلاعات حساب 👤":
-            subscription_info = self.user_obj.subscription_info()
-            plan_days = "نامحدود 💎" if subscription_info == "Unlimited" else ("بدون اشتراک" if subscription_info == "No Subscription" else subscription_info)
-            return self.bot.send_message(
-                chat_id=self.chat_id,
-                text=self.bot_messages.get_message("info_plan_message", user_id=self.user_id, plan_days=plan_days),
-                parse_mode="markdown"
-            )
+    def _show_pay_plans(self):
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text=self.bot_messages.get_message("payment_plan_message"),
+            reply_markup=self.inline_keyboard.pay_plan_keyboard(),
+            parse_mode="markdown"
+        )
+
+    def _show_account_info(self):
+        subscription_info = self.user_obj.subscription_info()
+        plan_days = "نامحدود 💎" if subscription_info == "Unlimited" else ("بدون اشتراک" if subscription_info == "No Subscription" else subscription_info)
+        return self.bot.send_message(
+            chat_id=self.chat_id,
+            text=self.bot_messages.get_message("info_plan_message", user_id=self.user_id, plan_days=plan_days),
+            parse_mode="markdown"
+        )
 
     # def second_button(self):
     #     """
@@ -258,13 +318,15 @@ class MessageHandler(BaseHandler):
     #         )
 
     def handle(self):
-        if self.is_update_mode():return  # noqa: E701
-        if self.is_user_block():return  # noqa: E701
+        if self._preflight():return  # noqa: E701
 
         if self.user_step:
-            if callback := self.steps.get(self.user_step): # step : "home"
-                return callback()
-
-            if callback := self.steps.get(self.user_step.split(":")[0]): # step : "home:info"
-                return callback()
-            AdminMessageHandler(self.update, self.bot).handle()
+            # step : "home" or "home:info", the part after ":" is kept for the step handler
+            step, _, self._step_arg = self.user_step.partition(":")
+            if name := self._STEPS.get(step):
+                return getattr(self, name)()
+            # only admins can be on an admin step, don't build the admin handler for anyone else
+            if self.user_obj.is_superuser:
+                admin_handler = AdminMessageHandler(self.update, self.bot)
+                admin_handler.user_obj = self.user_obj  # reuse the row loaded for this update
+                return admin_handler.handle()
@@ -1,105 +1,119 @@
 import json
 
+from django.core.cache import cache
+
 from apps.bot.models import Plan, Session
+from apps.telegram.buttons import (
+    BTN_ACCOUNT_INFO,
+    BTN_BACK,
+    BTN_BROADCAST,
+    BTN_BUY_SUBSCRIPTION,
+    BTN_CANCEL_UPLOAD,
+    BTN_EDIT,
+    BTN_FINISH_UPLOAD,
+    BTN_GIFT_SUBSCRIPTION,
+    BTN_SUPPORT,
+    BTN_UPLOAD,
+    BTN_UPLOAD_MOVIE,
+    BTN_UPLOAD_SERIES,
+    BTN_USER_INFO,
+)
 from utils.load_env import env
 
+# compact, un-escaped output: keyboards are plain dicts (no cycles to check) and
+# Persian labels stay 2 bytes each instead of a 6 character \uXXXX escape
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False).encode
+
+_PRIVATE_CHANNEL_URL = f"https://t.me/c/{env.PRIVATE_CHANNEL_ID}/"
+
+# static keyboards never change, so they are serialized once at import
+_HOME_KEYBOARD = _dumps({
+    "keyboard": [
+        [BTN_ACCOUNT_INFO, BTN_BUY_SUBSCRIPTION],
+        [BTN_GIFT_SUBSCRIPTION, BTN_SUPPORT]
+    ],
+    "resize_keyboard": True
+})
+_ADMIN_HOME_KEYBOARD = _dumps({
+    "keyboard": [
+        [BTN_BROADCAST, BTN_UPLOAD],
+        [BTN_EDIT, BTN_USER_INFO]
+    ],
+    "resize_keyboard": True
+})
+_ADMIN_UPLOAD_KEYBOARD = _dumps({
+    "keyboard": [
+        [BTN_UPLOAD_SERIES, BTN_UPLOAD_MOVIE],
+        [BTN_BACK]
+    ],
+    "resize_keyboard": True
+})
+_CANCEL_KEYBOARD = _dumps({
+    "keyboard": [
+        [BTN_CANCEL_UPLOAD, BTN_FINISH_UPLOAD]
+    ],
+    "resize_keyboard": True
+})
+_BACK_KEYBOARD = _dumps({
+    "keyboard": [
+        [BTN_BACK]
+    ],
+    "resize_keyboard": True
+})
+_REMOVE_REPLY_KEYBOARD = _dumps({"keyboard": []})
+_REMOVE_INLINE_KEYBOARD = _dumps({"inline_keyboard": []})
+
 
 class BaseKeyboard:
 
     def to_json(self, data: dict):
-        return json.dumps(data)
+        return _dumps(data)
 
 
 class ReplyKeyboardMarkup(BaseKeyboard):
 
     def home_keyboard(self):
-        markup = {
-            "keyboard": [
-                ["اطلاعات حساب 👤", "🛒 خرید اشتراک"],
-                ["گیفت اشتراک به دوستان 🎁", "💌 حمایت از مجموعه"]
-            ],
-            "resize_keyboard":True
-        }
-        return self.to_json(
-            data=markup
-        )
+        return _HOME_KEYBOARD
 
     def admin_home_keyboard(self):
-        markup = {
-            "keyboard": [
-                ["پیام همگانی 📡", "اپلود ⬇️"],
-                ["ویرایش ⚙️", "اطلاعات کاربر 💹"]
-            ],
-            "resize_keyboard":True
-        }
-        return self.to_json(
-            data=markup
-        )
+        return _ADMIN_HOME_KEYBOARD
 
     def admin_upload_keyboard(self):
-        markup = {
-            "keyboard": [
-                ["اپلود سریال ➕", "اپلود فیلم ➕"],
-                ["بازگشت"]
-            ],
-            "resize_keyboard":True
-        }
-        return self.to_json(
-            data=markup
-        )
+        return _ADMIN_UPLOAD_KEYBOARD
 
     def cancel_keyboard(self):
-        markup = {
-            "keyboard": [
-                ["لغو اپلود ❌", "اتمام اپلود ✅"]
-            ],
-            "resize_keyboard":True
-        }
-        return self.to_json(
-            data=markup
-        )
+        return _CANCEL_KEYBOARD
 
     def back_keyboard(self):
-        markup = {
-            "keyboard": [
-                ["بازگشت"]
-            ],
-            "resize_keyboard":True
-        }
-        return self.to_json(
-            data=markup
-        )
+        return _BACK_KEYBOARD
 
     def remove_keyboard(self):
-        markup = {"keyboard": []}
-        return self.to_json(
-            data=markup
-        )
+        return _REMOVE_REPLY_KEYBOARD
 
 class InlineKeyboardMarkup(BaseKeyboard):
 
     def pay_plan_keyboard(self):
-        plans = Plan.objects.filter(is_active=True)
-        child = []
-        for plan in plans.order_by("pk"):
-            child.append(
-                [{"text": f"{plan.name}", "callback_data": f"pay:{plan.pk}"}]
-            )
+        # plans rarely change; the cached JSON is dropped whenever a Plan is saved or deleted
+        return cache.get_or_set(Plan.KEYBOARD_CACHE_KEY, self._build_pay_plan_keyboard, Plan.CACHE_TIMEOUT)
+
+    def _build_pay_plan_keyboard(self):
+        plans = Plan.objects.filter(is_active=True).order_by("pk").values_list("pk", "name")
+        child = [
+            [{"text": f"{name}", "callback_data": f"pay:{pk}"}]
+            for pk, name in plans
+        ]
         markup = {
             "inline_keyboard": child
         }
         return self.to_json(data=markup)
 
     def remove_keyboard(self):
-        markup = {"inline_keyboard": []}
-        return self.to_json(
-            data=markup
-        )
+        return _REMOVE_INLINE_KEYBOARD
 
     def sponsor_channel_keyboard(self, channels):
 
         child = []
-        for channel in channels.order_by("-other"):
+        for channel in sorted(channels, key=lambda channel: not channel.other):
             child.append(
                 [{"text": f"{channel.name}", "url": channel.link}]
             )
@@ -115,25 +129,25 @@ class InlineKeyboardMarkup(BaseKeyboard):
         return self.to_json(data=markup)
 
     def edit_session_keyboard(self, session: Session):
-        child = []
-        for episode in session.episodes.order_by("order"):
-            child.append([
-                {"text": f"🎞️ قسمت {episode.order}", "callback_data": "_"},
-                {"text": "🗑️ حذف", "callback_data": f"edit_session:delete_e:{episode.id}"},
-                {"text": "🔗 لینک", "url": f"https://t.me/c/{env.PRIVATE_CHANNEL_ID}/{episode.message_id}"},
-            ])
+        episodes = session.episodes.order_by("order").values_list("id", "order", "message_id")
+        child = [
+            [
+                {"text": f"🎞️ قسمت {order}", "callback_data": "_"},
+                {"text": "🗑️ حذف", "callback_data": f"edit_session:delete_e:{episode_id}"},
+                {"text": "🔗 لینک", "url": f"{_PRIVATE_CHANNEL_URL}{message_id}"},
+            ]
+            for episode_id, order, message_id in episodes
+        ]
 
         if child:
-            child.append(
+            child.extend([
                 [
                     {"text": "➕ افزودن پارت جدید", "callback_data": f"edit_session:add_e:{session.id}"}
-                ]
-            )
-            child.append(
+                ],
                 [
                     {"text": "❌ حذف کل سشن", "callback_data": f"edit_session:delete_s:{session.id}"}
-                ]
-            )
+                ],
+            ])
 
         markup = {
             "inline_keyboard": child
@@ -1,7 +1,18 @@
+import hashlib
+import io
 import json
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from pathlib import PurePath
+from typing import IO, Any, Dict, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from apps.telegram._types import (
     InlineKeyboardMarkup,
@@ -13,6 +24,68 @@ from apps.telegram._types import (
     WebAppInfo,
 )
 from utils.load_env import env
+from utils.logger import logger
+
+
+# compact output without \uXXXX escapes; payload values are plain dicts/lists, so the
+# circular-reference bookkeeping is skipped too
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), check_circular=False).encode
+
+
+# element types _dumps handles as-is, so lists made only of these skip the per-item walk
+_PLAIN_ITEM_TYPES = frozenset((dict, list, str, int, float, bool))
+
+
+def _dumps_list(v):
+    try:
+        if all(type(i) in _PLAIN_ITEM_TYPES for i in v):
+            return _dumps(v)
+        # pydantic models and other pair-iterables become dicts first
+        return _dumps([dict(i) if hasattr(i, "__dict__") or isinstance(i, dict) else i for i in v])
+    except Exception:
+        return v
+
+
+# exact type -> serializer, the fast path for the plain dicts/lists callers pass
+_CONVERTERS = {dict: _dumps, list: _dumps_list}
+
+
+def _convert_value(v):
+    """
+    Serialize nested parameters (keyboards, entities, reply parameters...) to the JSON strings the Bot API expects.
+    """
+    convert = _CONVERTERS.get(type(v))
+    if convert:
+        return convert(v)
+    # subclasses (OrderedDict, custom list types...) are still JSON; scalars are sent as is
+    if isinstance(v, dict):
+        return _dumps(v)
+    if isinstance(v, (list, tuple)):
+        return _dumps_list(v)
+    return v
+
+
+def _is_upload(value) -> bool:
+    """
+    Whether a media argument is content to upload (bytes, an open binary file or a path on disk)
+    rather than a file_id/URL string.
+    """
+    return type(value) is bytes or isinstance(value, (io.IOBase, PurePath))
+
+
+def _upload_key(content) -> Optional[bytes]:
+    """
+    Content hash of raw upload bytes, used to recognise a file that was already sent; None for file_ids/URLs.
+    """
+    return hashlib.sha256(content).digest() if type(content) is bytes else None
+
+
+def _pack(**fields) -> Dict[str, Any]:
+    """
+    Build a request payload from keyword fields in one pass,
+    leaving out the ones that are None and serializing nested values.
+    """
+    return {k: _convert_value(v) for k, v in fields.items() if v is not None}
 
 
 class Telegram:
@@ -23,15 +96,42 @@ class Telegram:
 
     BASE_URL: str = "https://api.telegram.org/bot{}/{}"
     HEADERS: Dict[str, str] = {"Cache-Control": "no-cache"}
+    # read-only lookups passed `cache_ttl` are answered from memory for that many seconds
+    GET_CACHE_TTL: int = 30
+    GET_CACHE_SIZE: int = 1024
+    # sha256 of uploaded bytes -> file_id Telegram assigned, least recently used dropped first
+    UPLOAD_CACHE_SIZE: int = 512
 
     def __init__(self):
         self.token = env.get("TOKEN")
         if not self.token:
             raise ValueError("TOKEN is required in environment variables.")
 
+        self._url_prefix = self.BASE_URL.format(self.token, "")
+        self._urls: Dict[str, str] = {}  # method name -> full endpoint URL
+        self._get_cache: Dict[tuple, tuple] = {}  # (method name, params) -> (expires at, reply)
+        self._uploads: "OrderedDict[bytes, str]" = OrderedDict()
+        self._uploads_lock = threading.Lock()
+
         self.proxy = self._setup_proxy()
         self._session = requests.Session()
         self._session.headers.update(self.HEADERS)
+        # Only retry what cannot have been delivered twice: connection failures, 429 (honouring
+        # Retry-After) and 502/503. A read timeout, 500 or 504 may come after Telegram already
+        # sent the message, so read=0 and those statuses are returned to the caller as is.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=100,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503),
+                allowed_methods=frozenset(["GET", "POST"]),
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
 
     def _setup_proxy(self) -> Optional[Dict[str, str]]:
         """Configure SOCKS5 proxy if provided."""
@@ -41,7 +141,7 @@ class Telegram:
                 "http": f"socks5h://{proxy_socks}",
                 "https": f"socks5h://{proxy_socks}"
             }
-        return {}
+        return None
 
     def _make_request(
         self,
@@ -50,21 +150,25 @@ class Telegram:
         data: Optional[Dict[Any, Any]] = None,
         params: Optional[Dict[Any, Any]] = None,
         files: Optional[Dict[str, Any]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        cache_ttl: Optional[int] = None
     ) -> Dict[Any, Any]:
         """
         Send HTTP request to Telegram Bot API.
+        `data` and `params` are expected to come from `_pack`, so nested values are already serialized.
+        With `cache_ttl`, a successful reply is reused for identical calls during that many seconds;
+        only pass it for idempotent lookups.
         """
-        def _convert_value(v):
-            if isinstance(v, dict):
-                return json.dumps(v)
-            elif isinstance(v, list):
-                try:
-                    return json.dumps([dict(i) if hasattr(i, "__dict__") or isinstance(i, dict) else i for i in v])
-                except Exception:
-                    return v
-            return v
-        url = self.BASE_URL.format(self.token, method_name)
+        if cache_ttl:
+            cache_key = (method_name, tuple(sorted((params or {}).items())))
+            hit = self._get_cache.get(cache_key)
+            if hit and hit[0] > time.monotonic():
+                return hit[1]
+
+        url = self._urls.get(method_name)
+        if url is None:
+            url = self._urls.setdefault(method_name, self._url_prefix + method_name)
+
         # if data:
         #     for k, v in data.items():
         #         if isinstance(v, dict):
@@ -73,28 +177,84 @@ class Telegram:
         #     for k, v in data.items():
         #         if isinstance(v, dict):
         #             data[k] = json.dumps(v)
-        if data:
-            for k, v in data.items():
-                data[k] = _convert_value(v)
-
-        if params:
-            for k, v in params.items():
-                params[k] = _convert_value(v)
-        try:
-            if method.upper() == "GET":
-                response = self._session.get(
-                    url, params=params, proxies=self.proxy, timeout=timeout
-                )
-            else:
-                response = self._session.post(
-                    url, data=data, params=params, files=files,
-                    proxies=self.proxy, timeout=timeout
-                )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            print(f"[Telegram API Error] {method_name}: {e}")
-            return {"ok": False, "error": str(e)}
+        # paths are opened only for the duration of the request; the ExitStack closes every
+        # handle opened so far, also when a later open() fails
+        with ExitStack() as opened:
+            if files:
+                files = {
+                    name: opened.enter_context(open(value, "rb")) if isinstance(value, PurePath) else value
+                    for name, value in files.items()
+                }
+            try:
+                if method.upper() == "GET":
+                    response = self._session.get(
+                        url, params=params, proxies=self.proxy, timeout=timeout
+                    )
+                else:
+                    response = self._session.post(
+                        url, data=data, params=params, files=files,
+                        proxies=self.proxy, timeout=timeout
+                    )
+                response.raise_for_status()
+                # Bot API replies are always UTF-8 JSON; json.loads takes the bytes directly,
+                # skipping Response.json()'s encoding detection and decode step
+                result = json.loads(response.content)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning("Telegram API %s failed: %s", method_name, e)
+                return {"ok": False, "error": str(e)}
+
+        if cache_ttl and result.get("ok"):
+            if len(self._get_cache) >= self.GET_CACHE_SIZE:
+                self._get_cache.clear()
+            self._get_cache[cache_key] = (time.monotonic() + cache_ttl, result)
+        return result
+
+    def _remember_upload(self, upload_key: Optional[bytes], media_type: str, result: Dict[Any, Any]) -> Dict[Any, Any]:
+        """
+        Keep the file_id of a successful upload under its content hash and pass the reply through.
+        """
+        if upload_key and result.get("ok"):
+            media = result["result"].get(media_type)
+            if media:
+                with self._uploads_lock:
+                    self._uploads[upload_key] = media["file_id"]
+                    self._uploads.move_to_end(upload_key)
+                    if len(self._uploads) > self.UPLOAD_CACHE_SIZE:
+                        self._uploads.popitem(last=False)
+        return result
+
+    def _stored_file_id(self, upload_key: bytes) -> Optional[str]:
+        """
+        file_id remembered for these upload bytes, if any; a hit marks the entry as recently used.
+        """
+        with self._uploads_lock:
+            file_id = self._uploads.get(upload_key)
+            if file_id:
+                self._uploads.move_to_end(upload_key)
+        return file_id
+
+    def _retry_rejected_upload(
+        self,
+        method_name: str,
+        media_type: str,
+        upload_key: bytes,
+        content: bytes,
+        payload: Dict[str, Any],
+        result: Dict[Any, Any]
+    ) -> Dict[Any, Any]:
+        """
+        Check the reply to a send that reused a stored file_id. If Telegram rejected it,
+        forget the id and upload the original bytes once instead.
+        """
+        if result.get("ok"):
+            return result
+        with self._uploads_lock:
+            self._uploads.pop(upload_key, None)
+        payload.pop(media_type, None)
+        return self._remember_upload(
+            upload_key, media_type,
+            self._make_request(method_name, method="POST", data=payload, files={media_type: content})
+        )
 
     def close(self):
         """Close the session."""
@@ -106,6 +266,27 @@ class Telegram:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    @classmethod
+    @lru_cache(maxsize=1)
+    def shared(cls) -> "Telegram":
+        """
+        Process-wide client, so every update reuses the same keep-alive connection pool.
+        """
+        return cls()
+
+    def send_many(self, calls: List[tuple], max_workers: int = 16) -> List[Dict[Any, Any]]:
+        """
+        Run independent API calls side by side and return their replies in call order.
+        Each call is a `(method_name, fields)` pair, e.g. `("sendMessage", {"chat_id": 1, "text": "hi"})`.
+
+        The threads share this client's single Session: each request borrows its own
+        connection from the keep-alive pool, so up to `max_workers` calls are in flight at once.
+        """
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            return list(executor.map(lambda call: self._make_request(call[0], data=_pack(**call[1])), calls))
+
     # =============================
     # === SEND MESSAGE METHOD ===
     # =============================
@@ -148,28 +329,25 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard, or instructions to remove/force reply.
         :return: The sent Message object if successful, otherwise an error dictionary.
         """
-        payload = {
-            "chat_id": chat_id,
-            "text": text,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "parse_mode": parse_mode,
-            "entities": entities,
-            "link_preview_options": link_preview_options,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        # Remove None values before sending
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-
-        return self._make_request("sendMessage", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            text=text,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            parse_mode=parse_mode,
+            entities=entities,
+            link_preview_options=link_preview_options,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        return self._make_request("sendMessage", data=payload)
 
     def forward_message(
         self,
@@ -197,19 +375,18 @@ class Telegram:
         :param suggested_post_parameters: Parameters for sending a suggested post; for direct messages chats only.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "from_chat_id": from_chat_id,
-            "message_id": message_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "video_start_timestamp": video_start_timestamp,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "suggested_post_parameters": suggested_post_parameters,
-        }
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("forwardMessage", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            from_chat_id=from_chat_id,
+            message_id=message_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            video_start_timestamp=video_start_timestamp,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            suggested_post_parameters=suggested_post_parameters,
+        )
+        return self._make_request("forwardMessage", data=payload)
 
     def forward_messages(
         self,
@@ -233,17 +410,16 @@ class Telegram:
         :param protect_content: Protect the contents of the forwarded messages from forwarding and saving.
         :return: An array of MessageId objects for successfully sent messages.
         """
-        payload = {
-            "chat_id": chat_id,
-            "from_chat_id": from_chat_id,
-            "message_ids": json.dumps(message_ids),
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-        }
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("forwardMessages", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            from_chat_id=from_chat_id,
+            message_ids=_dumps(message_ids),
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+        )
+        return self._make_request("forwardMessages", data=payload)
 
     def copy_message(
         self,
@@ -285,26 +461,25 @@ class Telegram:
         :param reply_markup: Additional interface options (inline keyboard, reply keyboard, etc.).
         :return: A MessageId object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "from_chat_id": from_chat_id,
-            "message_id": message_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "video_start_timestamp": video_start_timestamp,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "show_caption_above_media": show_caption_above_media,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("copyMessage", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            from_chat_id=from_chat_id,
+            message_id=message_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            video_start_timestamp=video_start_timestamp,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            show_caption_above_media=show_caption_above_media,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("copyMessage", data=payload)
 
     def copy_messages(
         self,
@@ -330,18 +505,17 @@ class Telegram:
         :param remove_caption: Pass True to copy messages without their captions.
         :return: An array of MessageId objects for successfully sent messages.
         """
-        payload = {
-            "chat_id": chat_id,
-            "from_chat_id": from_chat_id,
-            "message_ids": json.dumps(message_ids),
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "remove_caption": remove_caption,
-        }
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("copyMessages", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            from_chat_id=from_chat_id,
+            message_ids=_dumps(message_ids),
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            remove_caption=remove_caption,
+        )
+        return self._make_request("copyMessages", data=payload)
 
     def send_photo(
         self,
@@ -364,7 +538,7 @@ class Telegram:
         reply_markup: Optional[ReplyMarkup] = None
     ) -> Dict[Any, Any]:
         """
-        Send a photo to a chat. Uses GET for file_id/URL, POST for raw bytes.
+        Send a photo to a chat. file_id/URL are sent as a form POST, raw bytes as multipart.
 
         :param chat_id: Unique identifier for the target chat or username (e.g. @channelusername).
         :param photo: Photo to send. Can be a file_id (str), URL (str), or raw bytes.
@@ -385,36 +559,33 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "show_caption_above_media": show_caption_above_media,
-            "has_spoiler": has_spoiler,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        if isinstance(photo, bytes):
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            show_caption_above_media=show_caption_above_media,
+            has_spoiler=has_spoiler,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        if type(photo) is bytes:
             # Upload new photo → use POST + multipart/form-data
             files = {"photo": photo}
-            payload["photo"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendPhoto", method="POST", data=filtered_payload, files=files)
+            return self._make_request("sendPhoto", method="POST", data=payload, files=files)
         else:
-            # Reuse existing file_id or URL → use GET
+            # Reuse existing file_id or URL → form-encoded POST, kept out of the query string
             payload["photo"] = photo
-            filtered_params = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendPhoto", method="GET", params=filtered_params)
+            return self._make_request("sendPhoto", method="POST", data=payload)
 
     def send_audio(
         self,
@@ -462,44 +633,41 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "duration": duration,
-            "performer": performer,
-            "title": title,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        if isinstance(audio, bytes):
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            duration=duration,
+            performer=performer,
+            title=title,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        if type(audio) is bytes:
             # Upload new audio → use POST + multipart/form-data
             files = {"audio": audio}
-            if isinstance(thumbnail, bytes):
+            if type(thumbnail) is bytes:
                 files["thumbnail"] = thumbnail
                 payload["thumbnail"] = "attach://thumbnail"
             elif thumbnail:
                 payload["thumbnail"] = thumbnail
-            payload["audio"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendAudio", method="POST", data=filtered_payload, files=files)
+            return self._make_request("sendAudio", method="POST", data=payload, files=files)
         else:
-            # Reuse existing file_id or URL → use GET
+            # Reuse existing file_id or URL → form-encoded POST, kept out of the query string
             payload["audio"] = audio
             if thumbnail:
                 payload["thumbnail"] = thumbnail
-            filtered_params = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendAudio", method="GET", params=filtered_params)
+            return self._make_request("sendAudio", method="POST", data=payload)
 
     def send_document(
         self,
@@ -522,7 +690,7 @@ class Telegram:
         reply_markup: Optional[ReplyMarkup] = None
     ) -> Dict[Any, Any]:
         """
-        Send a general file to a chat. Uses GET for file_id/URL, POST for raw bytes.
+        Send a general file to a chat. file_id/URL are sent as a form POST, raw bytes as multipart.
 
         :param chat_id: Unique identifier for the target chat or username (e.g. @channelusername).
         :param document: File to send. Can be a file_id (str), URL (str), or raw bytes.
@@ -543,55 +711,52 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "disable_content_type_detection": disable_content_type_detection,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        if isinstance(document, bytes):
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            disable_content_type_detection=disable_content_type_detection,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        if type(document) is bytes:
             # Upload new document → use POST + multipart/form-data
             files = {"document": document}
-            if isinstance(thumbnail, bytes):
+            if type(thumbnail) is bytes:
                 files["thumbnail"] = thumbnail
                 payload["thumbnail"] = "attach://thumbnail"
             elif thumbnail:
                 payload["thumbnail"] = thumbnail
-            payload["document"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendDocument", method="POST", data=filtered_payload, files=files)
+            return self._make_request("sendDocument", method="POST", data=payload, files=files)
         else:
-            # Reuse existing file_id or URL → use GET
+            # Reuse existing file_id or URL → form-encoded POST, kept out of the query string
             payload["document"] = document
             if thumbnail:
                 payload["thumbnail"] = thumbnail
-            filtered_params = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendDocument", method="GET", params=filtered_params)
+            return self._make_request("sendDocument", method="POST", data=payload)
 
     def send_video(
         self,
         chat_id: Union[int, str],
-        video: Union[str, bytes],
+        video: Union[str, bytes, IO[bytes], PurePath],
         business_connection_id: Optional[str] = None,
         message_thread_id: Optional[int] = None,
         direct_messages_topic_id: Optional[int] = None,
         duration: Optional[int] = None,
         width: Optional[int] = None,
         height: Optional[int] = None,
-        thumbnail: Optional[Union[str, bytes]] = None,
-        cover: Optional[Union[str, bytes]] = None,
+        thumbnail: Optional[Union[str, bytes, IO[bytes], PurePath]] = None,
+        cover: Optional[Union[str, bytes, IO[bytes], PurePath]] = None,
         start_timestamp: Optional[int] = None,
         caption: Optional[str] = None,
         parse_mode: Optional[str] = None,
@@ -608,17 +773,17 @@ class Telegram:
         reply_markup: Optional[ReplyMarkup] = None
     ) -> Dict[Any, Any]:
         """
-        Send a video file to a chat. Uses GET for file_id/URL, POST for raw bytes.
+        Send a video file to a chat. file_id/URL are sent as a form POST, uploads (bytes, file, Path) as multipart.
 
         :param chat_id: Unique identifier for the target chat or username (e.g. @channelusername).
-        :param video: Video to send. Can be a file_id (str), URL (str), or raw bytes.
+        :param video: Video to send. Can be a file_id (str), URL (str), raw bytes, an open binary file, or a Path.
         :param business_connection_id: Unique identifier of the business connection.
         :param message_thread_id: Unique identifier for the target message thread (topic) in a forum.
         :param direct_messages_topic_id: Identifier of the direct messages topic.
         :param duration: Duration of the video in seconds.
         :param width: Video width.
         :param height: Video height.
-        :param thumbnail: Thumbnail of the video (JPEG <200KB, max 320x320). Use bytes or file_id.
+        :param thumbnail: Thumbnail of the video (JPEG <200KB, max 320x320). Use bytes, an open binary file, a Path, or file_id.
         :param cover: Cover image for the video in the message. Use file_id, URL, or attach://<name>.
         :param start_timestamp: Start timestamp for the video (in seconds).
         :param caption: Video caption (0–1024 characters).
@@ -636,67 +801,77 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "duration": duration,
-            "width": width,
-            "height": height,
-            "start_timestamp": start_timestamp,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "show_caption_above_media": show_caption_above_media,
-            "has_spoiler": has_spoiler,
-            "supports_streaming": supports_streaming,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        if isinstance(video, bytes):
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            duration=duration,
+            width=width,
+            height=height,
+            start_timestamp=start_timestamp,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            show_caption_above_media=show_caption_above_media,
+            has_spoiler=has_spoiler,
+            supports_streaming=supports_streaming,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        upload_key = _upload_key(video)
+        reused_content = None
+        if upload_key and not _is_upload(thumbnail) and not _is_upload(cover):
+            # same bytes were uploaded before → send the file_id instead (thumbnails only apply to new uploads)
+            file_id = self._stored_file_id(upload_key)
+            if file_id:
+                reused_content, video = video, file_id
+
+        if _is_upload(video):
             # Upload new video → use POST + multipart/form-data
             files = {"video": video}
-            if isinstance(thumbnail, bytes):
+            if _is_upload(thumbnail):
                 files["thumbnail"] = thumbnail
                 payload["thumbnail"] = "attach://thumbnail"
             elif thumbnail:
                 payload["thumbnail"] = thumbnail
-            if isinstance(cover, bytes):
+            if _is_upload(cover):
                 files["cover"] = cover
                 payload["cover"] = "attach://cover"
             elif cover:
                 payload["cover"] = cover
-            payload["video"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendVideo", method="POST", data=filtered_payload, files=files)
+            return self._remember_upload(
+                upload_key, "video", self._make_request("sendVideo", method="POST", data=payload, files=files)
+            )
         else:
-            # Reuse existing file_id or URL → use GET
+            # Reuse existing file_id or URL → form-encoded POST, kept out of the query string
             payload["video"] = video
             if thumbnail:
                 payload["thumbnail"] = thumbnail
             if cover:
                 payload["cover"] = cover
-            filtered_params = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendVideo", method="GET", params=filtered_params)
+            result = self._make_request("sendVideo", method="POST", data=payload)
+            if reused_content is not None:
+                return self._retry_rejected_upload("sendVideo", "video", upload_key, reused_content, payload, result)
+            return result
 
     def send_animation(
         self,
         chat_id: Union[int, str],
-        animation: Union[str, bytes],
+        animation: Union[str, bytes, IO[bytes], PurePath],
         business_connection_id: Optional[str] = None,
         message_thread_id: Optional[int] = None,
         direct_messages_topic_id: Optional[int] = None,
         duration: Optional[int] = None,
         width: Optional[int] = None,
         height: Optional[int] = None,
-        thumbnail: Optional[Union[str, bytes]] = None,
+        thumbnail: Optional[Union[str, bytes, IO[bytes], PurePath]] = None,
         caption: Optional[str] = None,
         parse_mode: Optional[str] = None,
         caption_entities: Optional[List[MessageEntity]] = None,
@@ -714,14 +889,14 @@ class Telegram:
         Send an animation file (GIF or H.264/MPEG-4 AVC video without sound).
 
         :param chat_id: Unique identifier for the target chat or username (e.g. @channelusername).
-        :param animation: Animation to send. Can be a file_id (str), URL (str), or raw bytes.
+        :param animation: Animation to send. Can be a file_id (str), URL (str), raw bytes, an open binary file, or a Path.
         :param business_connection_id: Unique identifier of the business connection.
         :param message_thread_id: Unique identifier for the target message thread (topic) in a forum.
         :param direct_messages_topic_id: Identifier of the direct messages topic.
         :param duration: Duration of the animation in seconds.
         :param width: Animation width.
         :param height: Animation height.
-        :param thumbnail: Thumbnail of the file (JPEG <200KB, max 320x320). Use bytes or file_id.
+        :param thumbnail: Thumbnail of the file (JPEG <200KB, max 320x320). Use bytes, an open binary file, a Path, or file_id.
         :param caption: Animation caption (0–1024 characters).
         :param parse_mode: Mode for parsing entities in the caption ('HTML', 'MarkdownV2').
         :param caption_entities: List of special entities in the caption.
@@ -736,51 +911,61 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "duration": duration,
-            "width": width,
-            "height": height,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "show_caption_above_media": show_caption_above_media,
-            "has_spoiler": has_spoiler,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        if isinstance(animation, bytes):
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            duration=duration,
+            width=width,
+            height=height,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            show_caption_above_media=show_caption_above_media,
+            has_spoiler=has_spoiler,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        upload_key = _upload_key(animation)
+        reused_content = None
+        if upload_key and not _is_upload(thumbnail):
+            # same bytes were uploaded before → send the file_id instead (thumbnails only apply to new uploads)
+            file_id = self._stored_file_id(upload_key)
+            if file_id:
+                reused_content, animation = animation, file_id
+
+        if _is_upload(animation):
             # Upload new animation → use POST + multipart/form-data
             files = {"animation": animation}
-            if isinstance(thumbnail, bytes):
+            if _is_upload(thumbnail):
                 files["thumbnail"] = thumbnail
                 payload["thumbnail"] = "attach://thumbnail"
             elif thumbnail:
                 payload["thumbnail"] = thumbnail
-            payload["animation"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendAnimation", method="POST", data=filtered_payload, files=files)
+            return self._remember_upload(
+                upload_key, "animation", self._make_request("sendAnimation", method="POST", data=payload, files=files)
+            )
         else:
-            # Reuse existing file_id or URL → use GET
+            # Reuse existing file_id or URL → form-encoded POST, kept out of the query string
             payload["animation"] = animation
             if thumbnail:
                 payload["thumbnail"] = thumbnail
-            filtered_params = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendAnimation", method="GET", params=filtered_params)
+            result = self._make_request("sendAnimation", method="POST", data=payload)
+            if reused_content is not None:
+                return self._retry_rejected_upload("sendAnimation", "animation", upload_key, reused_content, payload, result)
+            return result
 
     def send_voice(
         self,
         chat_id: Union[int, str],
-        voice: Union[str, bytes],
+        voice: Union[str, bytes, IO[bytes], PurePath],
         business_connection_id: Optional[str] = None,
         message_thread_id: Optional[int] = None,
         direct_messages_topic_id: Optional[int] = None,
@@ -800,7 +985,7 @@ class Telegram:
         Send a voice message (audio file displayed as voice message).
 
         :param chat_id: Unique identifier for the target chat or username (e.g. @channelusername).
-        :param voice: Voice file to send. Can be a file_id (str), URL (str), or raw bytes (.OGG with OPUS, .MP3, .M4A).
+        :param voice: Voice file to send. Can be a file_id (str), URL (str), raw bytes, an open binary file, or a Path (.OGG with OPUS, .MP3, .M4A).
         :param business_connection_id: Unique identifier of the business connection.
         :param message_thread_id: Unique identifier for the target message thread (topic) in a forum.
         :param direct_messages_topic_id: Identifier of the direct messages topic.
@@ -817,46 +1002,56 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "duration": duration,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        if isinstance(voice, bytes):
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            duration=duration,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        upload_key = _upload_key(voice)
+        reused_content = None
+        if upload_key:
+            # same bytes were uploaded before → send the file_id instead
+            file_id = self._stored_file_id(upload_key)
+            if file_id:
+                reused_content, voice = voice, file_id
+
+        if _is_upload(voice):
             # Upload new voice → use POST + multipart/form-data
             files = {"voice": voice}
-            payload["voice"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendVoice", method="POST", data=filtered_payload, files=files)
+            return self._remember_upload(
+                upload_key, "voice", self._make_request("sendVoice", method="POST", data=payload, files=files)
+            )
         else:
-            # Reuse existing file_id or URL → use GET
+            # Reuse existing file_id or URL → form-encoded POST, kept out of the query string
             payload["voice"] = voice
-            filtered_params = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendVoice", method="GET", params=filtered_params)
+            result = self._make_request("sendVoice", method="POST", data=payload)
+            if reused_content is not None:
+                return self._retry_rejected_upload("sendVoice", "voice", upload_key, reused_content, payload, result)
+            return result
 
     def send_video_note(
         self,
         chat_id: Union[int, str],
-        video_note: Union[str, bytes],
+        video_note: Union[str, bytes, IO[bytes], PurePath],
         business_connection_id: Optional[str] = None,
         message_thread_id: Optional[int] = None,
         direct_messages_topic_id: Optional[int] = None,
         duration: Optional[int] = None,
         length: Optional[int] = None,
-        thumbnail: Optional[Union[str, bytes]] = None,
+        thumbnail: Optional[Union[str, bytes, IO[bytes], PurePath]] = None,
         disable_notification: Optional[bool] = None,
         protect_content: Optional[bool] = None,
         allow_paid_broadcast: Optional[bool] = None,
@@ -869,13 +1064,13 @@ class Telegram:
         Send a video note (round video message).
 
         :param chat_id: Unique identifier for the target chat or username (e.g. @channelusername).
-        :param video_note: Video note to send. Can be a file_id (str) or raw bytes. Sending via URL is not supported.
+        :param video_note: Video note to send. Can be a file_id (str), raw bytes, an open binary file, or a Path. Sending via URL is not supported.
         :param business_connection_id: Unique identifier of the business connection.
         :param message_thread_id: Unique identifier for the target message thread (topic) in a forum.
         :param direct_messages_topic_id: Identifier of the direct messages topic.
         :param duration: Duration of the video in seconds.
         :param length: Diameter of the video message (width and height are equal).
-        :param thumbnail: Thumbnail of the file (JPEG <200KB, max 320x320). Use bytes or file_id.
+        :param thumbnail: Thumbnail of the file (JPEG <200KB, max 320x320). Use bytes, an open binary file, a Path, or file_id.
         :param disable_notification: Send silently.
         :param protect_content: Protect from forwarding and saving.
         :param allow_paid_broadcast: Allow up to 1000 messages/sec for 0.1 Stars per message.
@@ -885,40 +1080,50 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "duration": duration,
-            "length": length,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        if isinstance(video_note, bytes):
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            duration=duration,
+            length=length,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+
+        upload_key = _upload_key(video_note)
+        reused_content = None
+        if upload_key and not _is_upload(thumbnail):
+            # same bytes were uploaded before → send the file_id instead (thumbnails only apply to new uploads)
+            file_id = self._stored_file_id(upload_key)
+            if file_id:
+                reused_content, video_note = video_note, file_id
+
+        if _is_upload(video_note):
             # Upload new video note → use POST + multipart/form-data
             files = {"video_note": video_note}
-            if isinstance(thumbnail, bytes):
+            if _is_upload(thumbnail):
                 files["thumbnail"] = thumbnail
                 payload["thumbnail"] = "attach://thumbnail"
             elif thumbnail:
                 payload["thumbnail"] = thumbnail
-            payload["video_note"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendVideoNote", method="POST", data=filtered_payload, files=files)
+            return self._remember_upload(
+                upload_key, "video_note", self._make_request("sendVideoNote", method="POST", data=payload, files=files)
+            )
         else:
-            # Reuse existing file_id → use GET (URL not supported per API)
+            # Reuse existing file_id → form-encoded POST (URL not supported per API)
             payload["video_note"] = video_note
             if thumbnail:
                 payload["thumbnail"] = thumbnail
-            filtered_params = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendVideoNote", method="GET", params=filtered_params)
+            result = self._make_request("sendVideoNote", method="POST", data=payload)
+            if reused_content is not None:
+                return self._retry_rejected_upload("sendVideoNote", "video_note", upload_key, reused_content, payload, result)
+            return result
 
     def send_paid_media(
         self,
@@ -963,28 +1168,26 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload_data = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "star_count": star_count,
-            "media": json.dumps(media),
-            "payload": payload,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "show_caption_above_media": show_caption_above_media,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload_data.items() if v is not None}
-        return self._make_request("sendPaidMedia", method="POST", data=filtered_payload)
+        payload_data = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            star_count=star_count,
+            media=_dumps(media),
+            payload=payload,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            show_caption_above_media=show_caption_above_media,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendPaidMedia", method="POST", data=payload_data)
 
     def send_media_group(
         self,
@@ -1015,21 +1218,19 @@ class Telegram:
         :param reply_parameters: Description of the message to reply to.
         :return: An array of sent Message objects on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "media": json.dumps(media),
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "reply_parameters": reply_parameters,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendMediaGroup", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            media=_dumps(media),
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            reply_parameters=reply_parameters,
+        )
+        return self._make_request("sendMediaGroup", method="POST", data=payload)
 
     def send_location(
         self,
@@ -1073,28 +1274,26 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "latitude": latitude,
-            "longitude": longitude,
-            "horizontal_accuracy": horizontal_accuracy,
-            "live_period": live_period,
-            "heading": heading,
-            "proximity_alert_radius": proximity_alert_radius,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendLocation", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            latitude=latitude,
+            longitude=longitude,
+            horizontal_accuracy=horizontal_accuracy,
+            live_period=live_period,
+            heading=heading,
+            proximity_alert_radius=proximity_alert_radius,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendLocation", method="POST", data=payload)
 
     def send_venue(
         self,
@@ -1142,30 +1341,28 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "latitude": latitude,
-            "longitude": longitude,
-            "title": title,
-            "address": address,
-            "foursquare_id": foursquare_id,
-            "foursquare_type": foursquare_type,
-            "google_place_id": google_place_id,
-            "google_place_type": google_place_type,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendVenue", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            latitude=latitude,
+            longitude=longitude,
+            title=title,
+            address=address,
+            foursquare_id=foursquare_id,
+            foursquare_type=foursquare_type,
+            google_place_id=google_place_id,
+            google_place_type=google_place_type,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendVenue", method="POST", data=payload)
 
     def send_contact(
         self,
@@ -1205,26 +1402,24 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "phone_number": phone_number,
-            "first_name": first_name,
-            "last_name": last_name,
-            "vcard": vcard,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendContact", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            phone_number=phone_number,
+            first_name=first_name,
+            last_name=last_name,
+            vcard=vcard,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendContact", method="POST", data=payload)
 
     def send_poll(
         self,
@@ -1282,34 +1477,32 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "question": question,
-            "question_parse_mode": question_parse_mode,
-            "question_entities": question_entities,
-            "options": json.dumps(options),
-            "is_anonymous": is_anonymous,
-            "type": poll_type,
-            "allows_multiple_answers": allows_multiple_answers,
-            "correct_option_id": correct_option_id,
-            "explanation": explanation,
-            "explanation_parse_mode": explanation_parse_mode,
-            "explanation_entities": explanation_entities,
-            "open_period": open_period,
-            "close_date": close_date,
-            "is_closed": is_closed,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendPoll", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            question=question,
+            question_parse_mode=question_parse_mode,
+            question_entities=question_entities,
+            options=_dumps(options),
+            is_anonymous=is_anonymous,
+            type=poll_type,
+            allows_multiple_answers=allows_multiple_answers,
+            correct_option_id=correct_option_id,
+            explanation=explanation,
+            explanation_parse_mode=explanation_parse_mode,
+            explanation_entities=explanation_entities,
+            open_period=open_period,
+            close_date=close_date,
+            is_closed=is_closed,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendPoll", method="POST", data=payload)
 
     def send_checklist(
         self,
@@ -1335,19 +1528,17 @@ class Telegram:
         :param reply_markup: Inline keyboard markup.
         :return: The sent Message object on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "checklist": json.dumps(checklist),
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "message_effect_id": message_effect_id,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendChecklist", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            checklist=_dumps(checklist),
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            message_effect_id=message_effect_id,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendChecklist", method="POST", data=payload)
 
     def send_dice(
         self,
@@ -1381,23 +1572,21 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "emoji": emoji,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendDice", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            emoji=emoji,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendDice", method="POST", data=payload)
 
     def send_chat_action(
         self,
@@ -1424,15 +1613,13 @@ class Telegram:
         :param message_thread_id: Unique identifier for the target message thread; for supergroups only.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "action": action,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendChatAction", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            action=action,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+        )
+        return self._make_request("sendChatAction", method="POST", data=payload)
 
     def set_message_reaction(
         self,
@@ -1450,15 +1637,13 @@ class Telegram:
         :param is_big: Pass True to show the reaction with a big animation.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "reaction": json.dumps(reaction) if reaction is not None else None,
-            "is_big": is_big,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setMessageReaction", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_id=message_id,
+            reaction=_dumps(reaction) if reaction is not None else None,
+            is_big=is_big,
+        )
+        return self._make_request("setMessageReaction", method="POST", data=payload)
 
     def get_user_profile_photos(
         self,
@@ -1474,14 +1659,12 @@ class Telegram:
         :param limit: Limits the number of photos to retrieve (1–100). Defaults to 100.
         :return: A UserProfilePhotos object on success.
         """
-        payload = {
-            "user_id": user_id,
-            "offset": offset,
-            "limit": limit,
-        }
-
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getUserProfilePhotos", method="GET", params=filtered_params)
+        payload = _pack(
+            user_id=user_id,
+            offset=offset,
+            limit=limit,
+        )
+        return self._make_request("getUserProfilePhotos", method="GET", params=payload)
 
     def set_user_emoji_status(
         self,
@@ -1497,14 +1680,12 @@ class Telegram:
         :param emoji_status_expiration_date: Unix timestamp when the emoji status should expire. Pass None for no expiration.
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "emoji_status_custom_emoji_id": emoji_status_custom_emoji_id,
-            "emoji_status_expiration_date": emoji_status_expiration_date,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setUserEmojiStatus", method="POST", data=filtered_payload)
+        payload = _pack(
+            user_id=user_id,
+            emoji_status_custom_emoji_id=emoji_status_custom_emoji_id,
+            emoji_status_expiration_date=emoji_status_expiration_date,
+        )
+        return self._make_request("setUserEmojiStatus", method="POST", data=payload)
 
     def get_file(
         self,
@@ -1542,15 +1723,13 @@ class Telegram:
                                 Always True for supergroups and channels.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-            "until_date": until_date,
-            "revoke_messages": revoke_messages,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("banChatMember", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+            until_date=until_date,
+            revoke_messages=revoke_messages,
+        )
+        return self._make_request("banChatMember", method="POST", data=payload)
 
     def unban_chat_member(
         self,
@@ -1569,14 +1748,12 @@ class Telegram:
         :param only_if_banned: Do nothing if the user is not currently banned.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-            "only_if_banned": only_if_banned,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("unbanChatMember", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+            only_if_banned=only_if_banned,
+        )
+        return self._make_request("unbanChatMember", method="POST", data=payload)
 
     def restrict_chat_member(
         self,
@@ -1600,16 +1777,14 @@ class Telegram:
                         Permanent if more than 366 days in the future or less than 30 seconds from now.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-            "permissions": json.dumps(permissions),
-            "use_independent_chat_permissions": use_independent_chat_permissions,
-            "until_date": until_date,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("restrictChatMember", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+            permissions=_dumps(permissions),
+            use_independent_chat_permissions=use_independent_chat_permissions,
+            until_date=until_date,
+        )
+        return self._make_request("restrictChatMember", method="POST", data=payload)
 
     def promote_chat_member(
         self,
@@ -1658,29 +1833,27 @@ class Telegram:
         :param can_manage_direct_messages: True if the admin can manage direct messages of the channel and decline suggested posts (channels only).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-            "is_anonymous": is_anonymous,
-            "can_manage_chat": can_manage_chat,
-            "can_delete_messages": can_delete_messages,
-            "can_manage_video_chats": can_manage_video_chats,
-            "can_restrict_members": can_restrict_members,
-            "can_promote_members": can_promote_members,
-            "can_change_info": can_change_info,
-            "can_invite_users": can_invite_users,
-            "can_post_stories": can_post_stories,
-            "can_edit_stories": can_edit_stories,
-            "can_delete_stories": can_delete_stories,
-            "can_post_messages": can_post_messages,
-            "can_edit_messages": can_edit_messages,
-            "can_pin_messages": can_pin_messages,
-            "can_manage_topics": can_manage_topics,
-            "can_manage_direct_messages": can_manage_direct_messages,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("promoteChatMember", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+            is_anonymous=is_anonymous,
+            can_manage_chat=can_manage_chat,
+            can_delete_messages=can_delete_messages,
+            can_manage_video_chats=can_manage_video_chats,
+            can_restrict_members=can_restrict_members,
+            can_promote_members=can_promote_members,
+            can_change_info=can_change_info,
+            can_invite_users=can_invite_users,
+            can_post_stories=can_post_stories,
+            can_edit_stories=can_edit_stories,
+            can_delete_stories=can_delete_stories,
+            can_post_messages=can_post_messages,
+            can_edit_messages=can_edit_messages,
+            can_pin_messages=can_pin_messages,
+            can_manage_topics=can_manage_topics,
+            can_manage_direct_messages=can_manage_direct_messages,
+        )
+        return self._make_request("promoteChatMember", method="POST", data=payload)
 
     def set_chat_administrator_custom_title(
         self,
@@ -1696,11 +1869,11 @@ class Telegram:
         :param custom_title: New custom title for the administrator (0–16 characters, emoji not allowed).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-            "custom_title": custom_title,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+            custom_title=custom_title,
+        )
         return self._make_request("setChatAdministratorCustomTitle", method="POST", data=payload)
 
     def ban_chat_sender_chat(
@@ -1717,10 +1890,10 @@ class Telegram:
         :param sender_chat_id: Unique identifier of the sender chat (i.e., the channel) to ban.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "sender_chat_id": sender_chat_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            sender_chat_id=sender_chat_id,
+        )
         return self._make_request("banChatSenderChat", method="POST", data=payload)
 
     def unban_chat_sender_chat(
@@ -1736,10 +1909,10 @@ class Telegram:
         :param sender_chat_id: Unique identifier of the sender chat (channel) to unban.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "sender_chat_id": sender_chat_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            sender_chat_id=sender_chat_id,
+        )
         return self._make_request("unbanChatSenderChat", method="POST", data=payload)
 
     def set_chat_permissions(
@@ -1758,14 +1931,12 @@ class Telegram:
                                                 If False, some permissions imply others.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "permissions": json.dumps(permissions),
-            "use_independent_chat_permissions": use_independent_chat_permissions,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setChatPermissions", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            permissions=_dumps(permissions),
+            use_independent_chat_permissions=use_independent_chat_permissions,
+        )
+        return self._make_request("setChatPermissions", method="POST", data=payload)
 
     def export_chat_invite_link(
         self,
@@ -1803,16 +1974,14 @@ class Telegram:
                                     If True, member_limit cannot be specified.
         :return: The new ChatInviteLink object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "name": name,
-            "expire_date": expire_date,
-            "member_limit": member_limit,
-            "creates_join_request": creates_join_request,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("createChatInviteLink", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            name=name,
+            expire_date=expire_date,
+            member_limit=member_limit,
+            creates_join_request=creates_join_request,
+        )
+        return self._make_request("createChatInviteLink", method="POST", data=payload)
 
     def edit_chat_invite_link(
         self,
@@ -1836,17 +2005,15 @@ class Telegram:
                                     If True, member_limit cannot be specified.
         :return: The edited ChatInviteLink object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "invite_link": invite_link,
-            "name": name,
-            "expire_date": expire_date,
-            "member_limit": member_limit,
-            "creates_join_request": creates_join_request,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editChatInviteLink", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            invite_link=invite_link,
+            name=name,
+            expire_date=expire_date,
+            member_limit=member_limit,
+            creates_join_request=creates_join_request,
+        )
+        return self._make_request("editChatInviteLink", method="POST", data=payload)
 
     def create_chat_subscription_invite_link(
         self,
@@ -1866,15 +2033,13 @@ class Telegram:
         :param name: Invite link name (0–32 characters).
         :return: The new ChatInviteLink object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "name": name,
-            "subscription_period": subscription_period,
-            "subscription_price": subscription_price,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("createChatSubscriptionInviteLink", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            name=name,
+            subscription_period=subscription_period,
+            subscription_price=subscription_price,
+        )
+        return self._make_request("createChatSubscriptionInviteLink", method="POST", data=payload)
 
     def edit_chat_subscription_invite_link(
         self,
@@ -1891,14 +2056,12 @@ class Telegram:
         :param name: New invite link name (0–32 characters).
         :return: The edited ChatInviteLink object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "invite_link": invite_link,
-            "name": name,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editChatSubscriptionInviteLink", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            invite_link=invite_link,
+            name=name,
+        )
+        return self._make_request("editChatSubscriptionInviteLink", method="POST", data=payload)
 
     def revoke_chat_invite_link(
         self,
@@ -1914,10 +2077,10 @@ class Telegram:
         :param invite_link: The invite link to revoke.
         :return: The revoked ChatInviteLink object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "invite_link": invite_link,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            invite_link=invite_link,
+        )
         return self._make_request("revokeChatInviteLink", method="POST", data=payload)
 
     def approve_chat_join_request(
@@ -1933,10 +2096,10 @@ class Telegram:
         :param user_id: Unique identifier of the user whose join request is approved.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+        )
         return self._make_request("approveChatJoinRequest", method="POST", data=payload)
 
     def decline_chat_join_request(
@@ -1952,10 +2115,10 @@ class Telegram:
         :param user_id: Unique identifier of the user whose join request is declined.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+        )
         return self._make_request("declineChatJoinRequest", method="POST", data=payload)
 
     def set_chat_photo(
@@ -2005,10 +2168,10 @@ class Telegram:
         :param title: New chat title (1–128 characters).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "title": title,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            title=title,
+        )
         return self._make_request("setChatTitle", method="POST", data=payload)
 
     def set_chat_description(
@@ -2024,13 +2187,11 @@ class Telegram:
         :param description: New chat description (0–255 characters). Pass empty string to remove.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "description": description,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setChatDescription", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            description=description,
+        )
+        return self._make_request("setChatDescription", method="POST", data=payload)
 
     def pin_chat_message(
         self,
@@ -2050,15 +2211,13 @@ class Telegram:
                                     Always disabled in channels and private chats.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "business_connection_id": business_connection_id,
-            "disable_notification": disable_notification,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("pinChatMessage", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_id=message_id,
+            business_connection_id=business_connection_id,
+            disable_notification=disable_notification,
+        )
+        return self._make_request("pinChatMessage", method="POST", data=payload)
 
     def unpin_chat_message(
         self,
@@ -2076,14 +2235,12 @@ class Telegram:
         :param business_connection_id: Unique identifier of the business connection on behalf of which the message is unpinned.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "business_connection_id": business_connection_id,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("unpinChatMessage", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_id=message_id,
+            business_connection_id=business_connection_id,
+        )
+        return self._make_request("unpinChatMessage", method="POST", data=payload)
 
     def unpin_all_chat_messages(
         self,
@@ -2126,7 +2283,7 @@ class Telegram:
         :return: A ChatFullInfo object on success.
         """
         payload = {"chat_id": chat_id}
-        return self._make_request("getChat", method="GET", params=payload)
+        return self._make_request("getChat", method="GET", params=payload, cache_ttl=self.GET_CACHE_TTL)
 
     def get_chat_administrators(
         self,
@@ -2140,7 +2297,9 @@ class Telegram:
         :return: Array of ChatMember objects on success.
         """
         payload = {"chat_id": chat_id}
-        return self._make_request("getChatAdministrators", method="GET", params=payload)
+        return self._make_request(
+            "getChatAdministrators", method="GET", params=payload, cache_ttl=self.GET_CACHE_TTL
+        )
 
     def get_chat_member_count(
         self,
@@ -2169,12 +2328,30 @@ class Telegram:
         :param user_id: Unique identifier of the target user.
         :return: A ChatMember object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+        )
         return self._make_request("getChatMember", method="GET", params=payload)
 
+    def is_join_channel(
+        self,
+        chat_id: Union[int, str],
+        user_id: int
+    ) -> bool:
+        """
+        Check whether a user is currently a member of a chat.
+
+        :param chat_id: Unique identifier for the target chat or username (e.g. @channelusername).
+        :param user_id: Unique identifier of the target user.
+        :return: True if the user is the owner, an administrator, or a (restricted) member.
+        """
+        response = self.get_chat_member(chat_id=chat_id, user_id=user_id)
+        if not response.get("ok"):
+            return False
+        member = response["result"]
+        return member.get("status") in ("creator", "administrator", "member") or bool(member.get("is_member"))
+
     def set_chat_sticker_set(
         self,
         chat_id: Union[int, str],
@@ -2189,10 +2366,10 @@ class Telegram:
         :param sticker_set_name: Name of the sticker set to set as the group sticker set.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "sticker_set_name": sticker_set_name,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            sticker_set_name=sticker_set_name,
+        )
         return self._make_request("setChatStickerSet", method="POST", data=payload)
 
     def delete_chat_sticker_set(
@@ -2239,15 +2416,13 @@ class Telegram:
                                     Use get_forum_topic_icon_stickers() to get allowed identifiers.
         :return: A ForumTopic object containing information about the created topic.
         """
-        payload = {
-            "chat_id": chat_id,
-            "name": name,
-            "icon_color": icon_color,
-            "icon_custom_emoji_id": icon_custom_emoji_id,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("createForumTopic", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            name=name,
+            icon_color=icon_color,
+            icon_custom_emoji_id=icon_custom_emoji_id,
+        )
+        return self._make_request("createForumTopic", method="POST", data=payload)
 
     def edit_forum_topic(
         self,
@@ -2268,15 +2443,13 @@ class Telegram:
                                     If not specified, icon remains unchanged.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_thread_id": message_thread_id,
-            "name": name,
-            "icon_custom_emoji_id": icon_custom_emoji_id,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editForumTopic", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+            name=name,
+            icon_custom_emoji_id=icon_custom_emoji_id,
+        )
+        return self._make_request("editForumTopic", method="POST", data=payload)
 
     def close_forum_topic(
         self,
@@ -2291,10 +2464,10 @@ class Telegram:
         :param message_thread_id: Unique identifier for the target message thread (topic).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_thread_id": message_thread_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        )
         return self._make_request("closeForumTopic", method="POST", data=payload)
 
     def reopen_forum_topic(
@@ -2310,10 +2483,10 @@ class Telegram:
         :param message_thread_id: Unique identifier for the target message thread (topic).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_thread_id": message_thread_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        )
         return self._make_request("reopenForumTopic", method="POST", data=payload)
 
     def delete_forum_topic(
@@ -2329,10 +2502,10 @@ class Telegram:
         :param message_thread_id: Unique identifier for the target message thread (topic).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_thread_id": message_thread_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        )
         return self._make_request("deleteForumTopic", method="POST", data=payload)
 
     def unpin_all_forum_topic_messages(
@@ -2348,10 +2521,10 @@ class Telegram:
         :param message_thread_id: Unique identifier for the target message thread (topic).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_thread_id": message_thread_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+        )
         return self._make_request("unpinAllForumTopicMessages", method="POST", data=payload)
 
     def edit_general_forum_topic(
@@ -2367,10 +2540,10 @@ class Telegram:
         :param name: New name for the 'General' topic (1–128 characters).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "name": name,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            name=name,
+        )
         return self._make_request("editGeneralForumTopic", method="POST", data=payload)
 
     def close_general_forum_topic(
@@ -2464,16 +2637,14 @@ class Telegram:
         :param cache_time: Maximum amount of time in seconds that the result may be cached client-side. Defaults to 0.
         :return: True on success.
         """
-        payload = {
-            "callback_query_id": callback_query_id,
-            "text": text,
-            "show_alert": show_alert,
-            "url": url,
-            "cache_time": cache_time,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("answerCallbackQuery", method="POST", data=filtered_payload)
+        payload = _pack(
+            callback_query_id=callback_query_id,
+            text=text,
+            show_alert=show_alert,
+            url=url,
+            cache_time=cache_time,
+        )
+        return self._make_request("answerCallbackQuery", method="POST", data=payload)
 
     def get_user_chat_boosts(
         self,
@@ -2488,10 +2659,10 @@ class Telegram:
         :param user_id: Unique identifier of the target user.
         :return: A UserChatBoosts object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "user_id": user_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            user_id=user_id,
+        )
         return self._make_request("getUserChatBoosts", method="GET", params=payload)
 
     def get_business_connection(
@@ -2521,14 +2692,12 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code. If empty, commands apply to all users in the scope without a dedicated language command.
         :return: True on success.
         """
-        payload = {
-            "commands": json.dumps(commands),
-            "scope": json.dumps(scope) if scope is not None else None,
-            "language_code": language_code,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setMyCommands", method="POST", data=filtered_payload)
+        payload = _pack(
+            commands=_dumps(commands),
+            scope=_dumps(scope) if scope is not None else None,
+            language_code=language_code,
+        )
+        return self._make_request("setMyCommands", method="POST", data=payload)
 
     def delete_my_commands(
         self,
@@ -2543,13 +2712,11 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code. If empty, applies to all users in the scope without a dedicated command.
         :return: True on success.
         """
-        payload = {
-            "scope": json.dumps(scope) if scope is not None else None,
-            "language_code": language_code,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("deleteMyCommands", method="POST", data=filtered_payload)
+        payload = _pack(
+            scope=_dumps(scope) if scope is not None else None,
+            language_code=language_code,
+        )
+        return self._make_request("deleteMyCommands", method="POST", data=payload)
 
     def get_my_commands(
         self,
@@ -2563,13 +2730,11 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code or empty string.
         :return: An array of BotCommand objects. Empty if no commands are set.
         """
-        payload = {
-            "scope": json.dumps(scope) if scope is not None else None,
-            "language_code": language_code,
-        }
-
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getMyCommands", method="GET", params=filtered_params)
+        payload = _pack(
+            scope=_dumps(scope) if scope is not None else None,
+            language_code=language_code,
+        )
+        return self._make_request("getMyCommands", method="GET", params=payload)
 
     def set_my_name(
         self,
@@ -2583,13 +2748,11 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code. If empty, name applies to all users without a dedicated name.
         :return: True on success.
         """
-        payload = {
-            "name": name,
-            "language_code": language_code,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setMyName", method="POST", data=filtered_payload)
+        payload = _pack(
+            name=name,
+            language_code=language_code,
+        )
+        return self._make_request("setMyName", method="POST", data=payload)
 
     def get_my_name(
         self,
@@ -2601,9 +2764,8 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code or empty string.
         :return: A BotName object on success.
         """
-        payload = {"language_code": language_code}
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getMyName", method="GET", params=filtered_params)
+        payload = _pack(language_code=language_code)
+        return self._make_request("getMyName", method="GET", params=payload)
 
     def set_my_description(
         self,
@@ -2617,13 +2779,11 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code. If empty, applies to all users without a dedicated description.
         :return: True on success.
         """
-        payload = {
-            "description": description,
-            "language_code": language_code,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setMyDescription", method="POST", data=filtered_payload)
+        payload = _pack(
+            description=description,
+            language_code=language_code,
+        )
+        return self._make_request("setMyDescription", method="POST", data=payload)
 
     def get_my_description(
         self,
@@ -2635,9 +2795,8 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code or empty string.
         :return: A BotDescription object on success.
         """
-        payload = {"language_code": language_code}
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getMyDescription", method="GET", params=filtered_params)
+        payload = _pack(language_code=language_code)
+        return self._make_request("getMyDescription", method="GET", params=payload)
 
     def set_my_short_description(
         self,
@@ -2651,13 +2810,11 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code. If empty, applies to all users without a dedicated short description.
         :return: True on success.
         """
-        payload = {
-            "short_description": short_description,
-            "language_code": language_code,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setMyShortDescription", method="POST", data=filtered_payload)
+        payload = _pack(
+            short_description=short_description,
+            language_code=language_code,
+        )
+        return self._make_request("setMyShortDescription", method="POST", data=payload)
 
     def get_my_short_description(
         self,
@@ -2669,9 +2826,8 @@ class Telegram:
         :param language_code: A two-letter ISO 639-1 language code or empty string.
         :return: A BotShortDescription object on success.
         """
-        payload = {"language_code": language_code}
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getMyShortDescription", method="GET", params=filtered_params)
+        payload = _pack(language_code=language_code)
+        return self._make_request("getMyShortDescription", method="GET", params=payload)
 
     def set_chat_menu_button(
         self,
@@ -2685,13 +2841,11 @@ class Telegram:
         :param menu_button: A JSON-serialized MenuButton object. Defaults to MenuButtonDefault.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "menu_button": json.dumps(menu_button) if menu_button is not None else None,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setChatMenuButton", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            menu_button=_dumps(menu_button) if menu_button is not None else None,
+        )
+        return self._make_request("setChatMenuButton", method="POST", data=payload)
 
     def get_chat_menu_button(
         self,
@@ -2703,9 +2857,8 @@ class Telegram:
         :param chat_id: Unique identifier for the target private chat. If not specified, returns the default menu button.
         :return: A MenuButton object on success.
         """
-        payload = {"chat_id": chat_id}
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getChatMenuButton", method="GET", params=filtered_params)
+        payload = _pack(chat_id=chat_id)
+        return self._make_request("getChatMenuButton", method="GET", params=payload)
 
     def set_my_default_administrator_rights(
         self,
@@ -2719,13 +2872,11 @@ class Telegram:
         :param for_channels: Pass True to change rights for channels. Otherwise, for groups/supergroups.
         :return: True on success.
         """
-        payload = {
-            "rights": json.dumps(rights) if rights is not None else None,
-            "for_channels": for_channels,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setMyDefaultAdministratorRights", method="POST", data=filtered_payload)
+        payload = _pack(
+            rights=_dumps(rights) if rights is not None else None,
+            for_channels=for_channels,
+        )
+        return self._make_request("setMyDefaultAdministratorRights", method="POST", data=payload)
 
     def get_my_default_administrator_rights(
         self,
@@ -2737,9 +2888,8 @@ class Telegram:
         :param for_channels: Pass True to get rights for channels. Otherwise, for groups/supergroups.
         :return: A ChatAdministratorRights object on success.
         """
-        payload = {"for_channels": for_channels}
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getMyDefaultAdministratorRights", method="GET", params=filtered_params)
+        payload = _pack(for_channels=for_channels)
+        return self._make_request("getMyDefaultAdministratorRights", method="GET", params=payload)
 
     def get_available_gifts(self) -> Dict[Any, Any]:
         """
@@ -2775,18 +2925,16 @@ class Telegram:
         if not (user_id or chat_id):
             raise ValueError("Either user_id or chat_id must be provided.")
 
-        payload = {
-            "user_id": user_id,
-            "chat_id": chat_id,
-            "gift_id": gift_id,
-            "pay_for_upgrade": pay_for_upgrade,
-            "text": text,
-            "text_parse_mode": text_parse_mode,
-            "text_entities": text_entities,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendGift", method="POST", data=filtered_payload)
+        payload = _pack(
+            user_id=user_id,
+            chat_id=chat_id,
+            gift_id=gift_id,
+            pay_for_upgrade=pay_for_upgrade,
+            text=text,
+            text_parse_mode=text_parse_mode,
+            text_entities=text_entities,
+        )
+        return self._make_request("sendGift", method="POST", data=payload)
 
     def gift_premium_subscription(
         self,
@@ -2810,17 +2958,15 @@ class Telegram:
                             Same restrictions apply as with text_parse_mode.
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "month_count": month_count,
-            "star_count": star_count,
-            "text": text,
-            "text_parse_mode": text_parse_mode,
-            "text_entities": text_entities,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("giftPremiumSubscription", method="POST", data=filtered_payload)
+        payload = _pack(
+            user_id=user_id,
+            month_count=month_count,
+            star_count=star_count,
+            text=text,
+            text_parse_mode=text_parse_mode,
+            text_entities=text_entities,
+        )
+        return self._make_request("giftPremiumSubscription", method="POST", data=payload)
 
     def verify_user(
         self,
@@ -2835,13 +2981,11 @@ class Telegram:
                                 Must be empty if the organization isn't allowed to set a custom description.
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "custom_description": custom_description,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("verifyUser", method="POST", data=filtered_payload)
+        payload = _pack(
+            user_id=user_id,
+            custom_description=custom_description,
+        )
+        return self._make_request("verifyUser", method="POST", data=payload)
 
     def verify_chat(
         self,
@@ -2856,13 +3000,11 @@ class Telegram:
                                 Must be empty if the organization isn't allowed to set a custom description.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "custom_description": custom_description,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("verifyChat", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            custom_description=custom_description,
+        )
+        return self._make_request("verifyChat", method="POST", data=payload)
 
     def remove_user_verification(
         self,
@@ -2907,11 +3049,11 @@ class Telegram:
         :param message_id: Unique identifier of the message to mark as read.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+        )
         return self._make_request("readBusinessMessage", method="POST", data=payload)
 
     def delete_business_messages(
@@ -2928,10 +3070,10 @@ class Telegram:
                             All messages must be from the same chat.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "message_ids": json.dumps(message_ids),
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            message_ids=_dumps(message_ids),
+        )
         return self._make_request("deleteBusinessMessages", method="POST", data=payload)
 
     def set_business_account_name(
@@ -2949,14 +3091,12 @@ class Telegram:
         :param last_name: New last name for the business account (0–64 characters).
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "first_name": first_name,
-            "last_name": last_name,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setBusinessAccountName", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            first_name=first_name,
+            last_name=last_name,
+        )
+        return self._make_request("setBusinessAccountName", method="POST", data=payload)
 
     def set_business_account_username(
         self,
@@ -2971,10 +3111,10 @@ class Telegram:
         :param username: New username for the business account (0–32 characters). Pass empty string to remove.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "username": username,
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            username=username,
+        )
         return self._make_request("setBusinessAccountUsername", method="POST", data=payload)
 
     def set_business_account_bio(
@@ -2990,10 +3130,10 @@ class Telegram:
         :param bio: New bio for the business account (0–140 characters). Pass empty string to remove.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "bio": bio,
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            bio=bio,
+        )
         return self._make_request("setBusinessAccountBio", method="POST", data=payload)
 
     def set_business_account_profile_photo(
@@ -3013,13 +3153,11 @@ class Telegram:
         :return: True on success.
         """
         files = {"photo": photo}
-        payload = {
-            "business_connection_id": business_connection_id,
-            "is_public": is_public,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setBusinessAccountProfilePhoto", method="POST", data=filtered_payload, files=files)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            is_public=is_public,
+        )
+        return self._make_request("setBusinessAccountProfilePhoto", method="POST", data=payload, files=files)
 
     def remove_business_account_profile_photo(
         self,
@@ -3035,13 +3173,11 @@ class Telegram:
                         After removing the main photo, the previous photo (if any) becomes the main one.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "is_public": is_public,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("removeBusinessAccountProfilePhoto", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            is_public=is_public,
+        )
+        return self._make_request("removeBusinessAccountProfilePhoto", method="POST", data=payload)
 
     def set_business_account_gift_settings(
         self,
@@ -3058,11 +3194,11 @@ class Telegram:
         :param accepted_gift_types: A JSON-serialized AcceptedGiftTypes object specifying which types of gifts are accepted.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "show_gift_button": show_gift_button,
-            "accepted_gift_types": json.dumps(accepted_gift_types),
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            show_gift_button=show_gift_button,
+            accepted_gift_types=_dumps(accepted_gift_types),
+        )
         return self._make_request("setBusinessAccountGiftSettings", method="POST", data=payload)
 
     def get_business_account_star_balance(
@@ -3092,10 +3228,10 @@ class Telegram:
         :param star_count: Number of Telegram Stars to transfer (1–10000).
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "star_count": star_count,
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            star_count=star_count,
+        )
         return self._make_request("transferBusinessAccountStars", method="POST", data=payload)
 
     def get_business_account_gifts(
@@ -3125,20 +3261,18 @@ class Telegram:
         :param limit: Maximum number of gifts to return (1–100, default: 100).
         :return: An OwnedGifts object on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "exclude_unsaved": exclude_unsaved,
-            "exclude_saved": exclude_saved,
-            "exclude_unlimited": exclude_unlimited,
-            "exclude_limited": exclude_limited,
-            "exclude_unique": exclude_unique,
-            "sort_by_price": sort_by_price,
-            "offset": offset,
-            "limit": limit,
-        }
-
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getBusinessAccountGifts", method="GET", params=filtered_params)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            exclude_unsaved=exclude_unsaved,
+            exclude_saved=exclude_saved,
+            exclude_unlimited=exclude_unlimited,
+            exclude_limited=exclude_limited,
+            exclude_unique=exclude_unique,
+            sort_by_price=sort_by_price,
+            offset=offset,
+            limit=limit,
+        )
+        return self._make_request("getBusinessAccountGifts", method="GET", params=payload)
 
     def convert_gift_to_stars(
         self,
@@ -3153,10 +3287,10 @@ class Telegram:
         :param owned_gift_id: Unique identifier of the regular gift to convert.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "owned_gift_id": owned_gift_id,
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            owned_gift_id=owned_gift_id,
+        )
         return self._make_request("convertGiftToStars", method="POST", data=payload)
 
     def upgrade_gift(
@@ -3178,15 +3312,13 @@ class Telegram:
                         If the gift has a prepaid upgrade, pass 0. Otherwise, this value must match the gift's upgrade cost.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "owned_gift_id": owned_gift_id,
-            "keep_original_details": keep_original_details,
-            "star_count": star_count,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("upgradeGift", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            owned_gift_id=owned_gift_id,
+            keep_original_details=keep_original_details,
+            star_count=star_count,
+        )
+        return self._make_request("upgradeGift", method="POST", data=payload)
 
     def transfer_gift(
         self,
@@ -3206,15 +3338,13 @@ class Telegram:
         :param star_count: Amount of Telegram Stars to pay for the transfer. If 0 or omitted, transfer is free.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "owned_gift_id": owned_gift_id,
-            "new_owner_chat_id": new_owner_chat_id,
-            "star_count": star_count,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("transferGift", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            owned_gift_id=owned_gift_id,
+            new_owner_chat_id=new_owner_chat_id,
+            star_count=star_count,
+        )
+        return self._make_request("transferGift", method="POST", data=payload)
 
     def post_story(
         self,
@@ -3243,20 +3373,18 @@ class Telegram:
         :param protect_content: Pass True to protect the story from forwarding and screenshots.
         :return: A Story object on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "content": json.dumps(content),
-            "active_period": active_period,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "areas": json.dumps(areas) if areas is not None else None,
-            "post_to_chat_page": post_to_chat_page,
-            "protect_content": protect_content,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("postStory", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            content=_dumps(content),
+            active_period=active_period,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            areas=_dumps(areas) if areas is not None else None,
+            post_to_chat_page=post_to_chat_page,
+            protect_content=protect_content,
+        )
+        return self._make_request("postStory", method="POST", data=payload)
 
     def edit_story(
         self,
@@ -3281,18 +3409,16 @@ class Telegram:
         :param areas: List of clickable StoryArea objects to replace existing ones.
         :return: The updated Story object on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "story_id": story_id,
-            "content": json.dumps(content),
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "areas": json.dumps(areas) if areas is not None else None,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editStory", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            story_id=story_id,
+            content=_dumps(content),
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            areas=_dumps(areas) if areas is not None else None,
+        )
+        return self._make_request("editStory", method="POST", data=payload)
 
     def delete_story(
         self,
@@ -3307,10 +3433,10 @@ class Telegram:
         :param story_id: Unique identifier of the story to delete.
         :return: True on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "story_id": story_id,
-        }
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            story_id=story_id,
+        )
         return self._make_request("deleteStory", method="POST", data=payload)
 
     def edit_message_text(
@@ -3343,20 +3469,18 @@ class Telegram:
         if not (chat_id and message_id) and not inline_message_id:
             raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "inline_message_id": inline_message_id,
-            "text": text,
-            "parse_mode": parse_mode,
-            "entities": entities,
-            "link_preview_options": link_preview_options,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editMessageText", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            text=text,
+            parse_mode=parse_mode,
+            entities=entities,
+            link_preview_options=link_preview_options,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("editMessageText", method="POST", data=payload)
 
     def edit_message_caption(
         self,
@@ -3388,20 +3512,18 @@ class Telegram:
         if not (chat_id and message_id) and not inline_message_id:
             raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "inline_message_id": inline_message_id,
-            "caption": caption,
-            "parse_mode": parse_mode,
-            "caption_entities": caption_entities,
-            "show_caption_above_media": show_caption_above_media,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editMessageCaption", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            caption=caption,
+            parse_mode=parse_mode,
+            caption_entities=caption_entities,
+            show_caption_above_media=show_caption_above_media,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("editMessageCaption", method="POST", data=payload)
 
     def edit_message_media(
         self,
@@ -3429,17 +3551,15 @@ class Telegram:
         if not (chat_id and message_id) and not inline_message_id:
             raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "inline_message_id": inline_message_id,
-            "media": json.dumps(media),
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editMessageMedia", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            media=_dumps(media),
+            reply_markup=reply_markup,
+        )
+        return self._make_request("editMessageMedia", method="POST", data=payload)
 
     def edit_message_live_location(
         self,
@@ -3478,22 +3598,20 @@ class Telegram:
         if not (chat_id and message_id) and not inline_message_id:
             raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "inline_message_id": inline_message_id,
-            "latitude": latitude,
-            "longitude": longitude,
-            "live_period": live_period,
-            "horizontal_accuracy": horizontal_accuracy,
-            "heading": heading,
-            "proximity_alert_radius": proximity_alert_radius,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editMessageLiveLocation", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            latitude=latitude,
+            longitude=longitude,
+            live_period=live_period,
+            horizontal_accuracy=horizontal_accuracy,
+            heading=heading,
+            proximity_alert_radius=proximity_alert_radius,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("editMessageLiveLocation", method="POST", data=payload)
 
     def stop_message_live_location(
         self,
@@ -3517,16 +3635,14 @@ class Telegram:
         if not (chat_id and message_id) and not inline_message_id:
             raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "inline_message_id": inline_message_id,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("stopMessageLiveLocation", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("stopMessageLiveLocation", method="POST", data=payload)
 
     def edit_message_checklist(
         self,
@@ -3546,16 +3662,14 @@ class Telegram:
         :param reply_markup: A JSON-serialized object for a new inline keyboard.
         :return: The edited Message object on success.
         """
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "checklist": json.dumps(checklist),
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editMessageChecklist", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            checklist=_dumps(checklist),
+            reply_markup=reply_markup,
+        )
+        return self._make_request("editMessageChecklist", method="POST", data=payload)
 
     def edit_message_reply_markup(
         self,
@@ -3579,16 +3693,14 @@ class Telegram:
         if not (chat_id and message_id) and not inline_message_id:
             raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-        payload = {
-            "business_connection_id": business_connection_id,
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "inline_message_id": inline_message_id,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("editMessageReplyMarkup", method="POST", data=filtered_payload)
+        payload = _pack(
+            business_connection_id=business_connection_id,
+            chat_id=chat_id,
+            message_id=message_id,
+            inline_message_id=inline_message_id,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("editMessageReplyMarkup", method="POST", data=payload)
 
     def stop_poll(
         self,
@@ -3607,15 +3719,13 @@ class Telegram:
         :param reply_markup: A JSON-serialized object for a new inline keyboard attached to the message.
         :return: The stopped Poll object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "business_connection_id": business_connection_id,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("stopPoll", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_id=message_id,
+            business_connection_id=business_connection_id,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("stopPoll", method="POST", data=payload)
 
     def approve_suggested_post(
         self,
@@ -3634,14 +3744,12 @@ class Telegram:
                         Omit if already specified during creation.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "send_date": send_date,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("approveSuggestedPost", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_id=message_id,
+            send_date=send_date,
+        )
+        return self._make_request("approveSuggestedPost", method="POST", data=payload)
 
     def decline_suggested_post(
         self,
@@ -3658,14 +3766,12 @@ class Telegram:
         :param comment: Comment for the creator of the suggested post (0–128 characters).
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "comment": comment,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("declineSuggestedPost", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_id=message_id,
+            comment=comment,
+        )
+        return self._make_request("declineSuggestedPost", method="POST", data=payload)
 
     def delete_message(
         self,
@@ -3688,10 +3794,10 @@ class Telegram:
         :param message_id: Identifier of the message to delete.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            message_id=message_id,
+        )
         return self._make_request("deleteMessage", method="POST", data=payload)
 
     def delete_messages(
@@ -3708,10 +3814,10 @@ class Telegram:
                             See delete_message() for limitations on deletable messages.
         :return: True on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "message_ids": json.dumps(message_ids),
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            message_ids=_dumps(message_ids),
+        )
         return self._make_request("deleteMessages", method="POST", data=payload)
 
     def send_sticker(
@@ -3753,32 +3859,29 @@ class Telegram:
         :param reply_markup: Inline or reply keyboard.
         :return: The sent Message object on success.
         """
-        payload = {
-            "chat_id": chat_id,
-            "business_connection_id": business_connection_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "emoji": emoji,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
+        payload = _pack(
+            chat_id=chat_id,
+            business_connection_id=business_connection_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            emoji=emoji,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
 
         if isinstance(sticker, bytes):
             # Upload new sticker → use POST + multipart/form-data
             files = {"sticker": sticker}
-            payload["sticker"] = None
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendSticker", method="POST", data=filtered_payload, files=files)
+            return self._make_request("sendSticker", method="POST", data=payload, files=files)
         else:
             # Reuse existing file_id or URL → use POST (GET not supported for stickers)
             payload["sticker"] = sticker
-            filtered_payload = {k: v for k, v in payload.items() if v is not None}
-            return self._make_request("sendSticker", method="POST", data=filtered_payload)
+            return self._make_request("sendSticker", method="POST", data=payload)
 
     def get_sticker_set(
         self,
@@ -3803,7 +3906,7 @@ class Telegram:
         :param custom_emoji_ids: A list of up to 200 unique identifiers of custom emoji stickers.
         :return: An Array of Sticker objects on success.
         """
-        payload = {"custom_emoji_ids": json.dumps(custom_emoji_ids)}
+        payload = {"custom_emoji_ids": _dumps(custom_emoji_ids)}
         return self._make_request("getCustomEmojiStickers", method="POST", data=payload)
 
     def upload_sticker_file(
@@ -3823,10 +3926,10 @@ class Telegram:
         :return: The uploaded File object on success.
         """
         files = {"sticker": sticker}
-        payload = {
-            "user_id": user_id,
-            "sticker_format": sticker_format,
-        }
+        payload = _pack(
+            user_id=user_id,
+            sticker_format=sticker_format,
+        )
         return self._make_request("uploadStickerFile", method="POST", data=payload, files=files)
 
     def create_new_sticker_set(
@@ -3849,17 +3952,15 @@ class Telegram:
         :param needs_repainting: For custom emoji sets: True if stickers should adapt to context color (text, status, etc.).
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "name": name,
-            "title": title,
-            "stickers": json.dumps(stickers),
-            "sticker_type": sticker_type,
-            "needs_repainting": needs_repainting,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("createNewStickerSet", method="POST", data=filtered_payload)
+        payload = _pack(
+            user_id=user_id,
+            name=name,
+            title=title,
+            stickers=_dumps(stickers),
+            sticker_type=sticker_type,
+            needs_repainting=needs_repainting,
+        )
+        return self._make_request("createNewStickerSet", method="POST", data=payload)
 
     def add_sticker_to_set(
         self,
@@ -3878,11 +3979,11 @@ class Telegram:
                         If the same sticker exists, the set is not changed.
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "name": name,
-            "sticker": json.dumps(sticker),
-        }
+        payload = _pack(
+            user_id=user_id,
+            name=name,
+            sticker=_dumps(sticker),
+        )
         return self._make_request("addStickerToSet", method="POST", data=payload)
 
     def set_sticker_position_in_set(
@@ -3897,10 +3998,10 @@ class Telegram:
         :param position: New position of the sticker in the set.
         :return: True on success.
         """
-        payload = {
-            "sticker": sticker,
-            "position": position,
-        }
+        payload = _pack(
+            sticker=sticker,
+            position=position,
+        )
         return self._make_request("setStickerPositionInSet", method="POST", data=payload)
 
     def delete_sticker_from_set(
@@ -3933,12 +4034,12 @@ class Telegram:
         :param sticker: An InputSticker object with the new sticker data.
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "name": name,
-            "old_sticker": old_sticker,
-            "sticker": json.dumps(sticker),
-        }
+        payload = _pack(
+            user_id=user_id,
+            name=name,
+            old_sticker=old_sticker,
+            sticker=_dumps(sticker),
+        )
         return self._make_request("replaceStickerInSet", method="POST", data=payload)
 
     def set_sticker_emoji_list(
@@ -3954,10 +4055,10 @@ class Telegram:
         :param emoji_list: List of 1–20 emoji to associate with the sticker.
         :return: True on success.
         """
-        payload = {
-            "sticker": sticker,
-            "emoji_list": json.dumps(emoji_list),
-        }
+        payload = _pack(
+            sticker=sticker,
+            emoji_list=_dumps(emoji_list),
+        )
         return self._make_request("setStickerEmojiList", method="POST", data=payload)
 
     def set_sticker_keywords(
@@ -3974,13 +4075,11 @@ class Telegram:
         :param keywords: List of 0–20 search keywords. Pass empty list or omit to remove.
         :return: True on success.
         """
-        payload = {
-            "sticker": sticker,
-            "keywords": json.dumps(keywords) if keywords is not None else None,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setStickerKeywords", method="POST", data=filtered_payload)
+        payload = _pack(
+            sticker=sticker,
+            keywords=_dumps(keywords) if keywords is not None else None,
+        )
+        return self._make_request("setStickerKeywords", method="POST", data=payload)
 
     def set_sticker_mask_position(
         self,
@@ -3997,13 +4096,11 @@ class Telegram:
                             where the mask should be placed on the face. Pass None to remove.
         :return: True on success.
         """
-        payload = {
-            "sticker": sticker,
-            "mask_position": json.dumps(mask_position) if mask_position is not None else None,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setStickerMaskPosition", method="POST", data=filtered_payload)
+        payload = _pack(
+            sticker=sticker,
+            mask_position=_dumps(mask_position) if mask_position is not None else None,
+        )
+        return self._make_request("setStickerMaskPosition", method="POST", data=payload)
 
     def set_sticker_set_title(
         self,
@@ -4017,10 +4114,10 @@ class Telegram:
         :param title: New title for the sticker set (1–64 characters).
         :return: True on success.
         """
-        payload = {
-            "name": name,
-            "title": title,
-        }
+        payload = _pack(
+            name=name,
+            title=title,
+        )
         return self._make_request("setStickerSetTitle", method="POST", data=payload)
 
     def set_sticker_set_thumbnail(
@@ -4049,22 +4146,19 @@ class Telegram:
         :param format: Format of the thumbnail: 'static', 'animated', or 'video'.
         :return: True on success.
         """
-        payload = {
-            "name": name,
-            "user_id": user_id,
-            "format": format,
-        }
+        payload = _pack(
+            name=name,
+            user_id=user_id,
+            format=format,
+        )
 
         files = None
         if isinstance(thumbnail, bytes):
             files = {"thumbnail": thumbnail}
-            payload["thumbnail"] = None
         elif thumbnail is not None:
             payload["thumbnail"] = thumbnail
         # else: omit thumbnail to drop it
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("setStickerSetThumbnail", method="POST", data=filtered_payload, files=files)
+        return self._make_request("setStickerSetThumbnail", method="POST", data=payload, files=files)
 
     def set_custom_emoji_sticker_set_thumbnail(
         self,
@@ -4079,10 +4173,10 @@ class Telegram:
                                 Pass an empty string or None to remove the thumbnail and use the first sticker instead.
         :return: True on success.
         """
-        payload = {
-            "name": name,
-            "custom_emoji_id": custom_emoji_id,
-        }
+        payload = _pack(
+            name=name,
+            custom_emoji_id=custom_emoji_id,
+        )
 
         # We include custom_emoji_id even if None (to allow empty string for removal)
         return self._make_request("setCustomEmojiStickerSetThumbnail", method="POST", data=payload)
@@ -4122,17 +4216,15 @@ class Telegram:
         :param button: A JSON-serialized object describing a button to be shown above the results.
         :return: True on success.
         """
-        payload = {
-            "inline_query_id": inline_query_id,
-            "results": json.dumps(results),
-            "cache_time": cache_time,
-            "is_personal": is_personal,
-            "next_offset": next_offset,
-            "button": json.dumps(button) if button is not None else None,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("answerInlineQuery", method="POST", data=filtered_payload)
+        payload = _pack(
+            inline_query_id=inline_query_id,
+            results=_dumps(results),
+            cache_time=cache_time,
+            is_personal=is_personal,
+            next_offset=next_offset,
+            button=_dumps(button) if button is not None else None,
+        )
+        return self._make_request("answerInlineQuery", method="POST", data=payload)
 
     def create_inline_query_result_article(
         id: str,
@@ -5334,10 +5426,10 @@ class Telegram:
                     Must be one of the supported result types (e.g., article, photo, video, etc.).
         :return: A SentWebAppMessage object on success.
         """
-        payload = {
-            "web_app_query_id": web_app_query_id,
-            "result": json.dumps(result),
-        }
+        payload = _pack(
+            web_app_query_id=web_app_query_id,
+            result=_dumps(result),
+        )
         return self._make_request("answerWebAppQuery", method="POST", data=payload)
 
     def create_sent_web_app_message(
@@ -5378,17 +5470,15 @@ class Telegram:
         :param allow_channel_chats: Pass True if the message can be sent to channel chats.
         :return: A PreparedInlineMessage object on success.
         """
-        payload = {
-            "user_id": user_id,
-            "result": json.dumps(result),
-            "allow_user_chats": allow_user_chats,
-            "allow_bot_chats": allow_bot_chats,
-            "allow_group_chats": allow_group_chats,
-            "allow_channel_chats": allow_channel_chats,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("savePreparedInlineMessage", method="POST", data=filtered_payload)
+        payload = _pack(
+            user_id=user_id,
+            result=_dumps(result),
+            allow_user_chats=allow_user_chats,
+            allow_bot_chats=allow_bot_chats,
+            allow_group_chats=allow_group_chats,
+            allow_channel_chats=allow_channel_chats,
+        )
+        return self._make_request("savePreparedInlineMessage", method="POST", data=payload)
 
     def create_prepared_inline_message(
         id: str,
@@ -5487,42 +5577,40 @@ class Telegram:
         if currency == "XTR" and (provider_token is not None and provider_token != ""):
             raise ValueError("For payments in Telegram Stars (XTR), provider_token must be an empty string.")
 
-        payload = {
-            "chat_id": chat_id,
-            "message_thread_id": message_thread_id,
-            "direct_messages_topic_id": direct_messages_topic_id,
-            "title": title,
-            "description": description,
-            "payload": payload,
-            "provider_token": provider_token,
-            "currency": currency,
-            "prices": json.dumps(prices),
-            "max_tip_amount": max_tip_amount,
-            "suggested_tip_amounts": suggested_tip_amounts,
-            "start_parameter": start_parameter,
-            "provider_data": provider_data,
-            "photo_url": photo_url,
-            "photo_size": photo_size,
-            "photo_width": photo_width,
-            "photo_height": photo_height,
-            "need_name": need_name,
-            "need_phone_number": need_phone_number,
-            "need_email": need_email,
-            "need_shipping_address": need_shipping_address,
-            "send_phone_number_to_provider": send_phone_number_to_provider,
-            "send_email_to_provider": send_email_to_provider,
-            "is_flexible": is_flexible,
-            "disable_notification": disable_notification,
-            "protect_content": protect_content,
-            "allow_paid_broadcast": allow_paid_broadcast,
-            "message_effect_id": message_effect_id,
-            "suggested_post_parameters": suggested_post_parameters,
-            "reply_parameters": reply_parameters,
-            "reply_markup": reply_markup,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("sendInvoice", method="POST", data=filtered_payload)
+        payload = _pack(
+            chat_id=chat_id,
+            message_thread_id=message_thread_id,
+            direct_messages_topic_id=direct_messages_topic_id,
+            title=title,
+            description=description,
+            payload=payload,
+            provider_token=provider_token,
+            currency=currency,
+            prices=_dumps(prices),
+            max_tip_amount=max_tip_amount,
+            suggested_tip_amounts=suggested_tip_amounts,
+            start_parameter=start_parameter,
+            provider_data=provider_data,
+            photo_url=photo_url,
+            photo_size=photo_size,
+            photo_width=photo_width,
+            photo_height=photo_height,
+            need_name=need_name,
+            need_phone_number=need_phone_number,
+            need_email=need_email,
+            need_shipping_address=need_shipping_address,
+            send_phone_number_to_provider=send_phone_number_to_provider,
+            send_email_to_provider=send_email_to_provider,
+            is_flexible=is_flexible,
+            disable_notification=disable_notification,
+            protect_content=protect_content,
+            allow_paid_broadcast=allow_paid_broadcast,
+            message_effect_id=message_effect_id,
+            suggested_post_parameters=suggested_post_parameters,
+            reply_parameters=reply_parameters,
+            reply_markup=reply_markup,
+        )
+        return self._make_request("sendInvoice", method="POST", data=payload)
 
     def create_invoice_link(
         self,
@@ -5588,33 +5676,31 @@ class Telegram:
             if subscription_period is not None and subscription_period != 2592000:
                 raise ValueError("For Telegram Stars subscriptions, subscription_period must be 2592000 (30 days).")
 
-        payload_data = {
-            "business_connection_id": business_connection_id,
-            "title": title,
-            "description": description,
-            "payload": payload,
-            "provider_token": provider_token,
-            "currency": currency,
-            "prices": json.dumps(prices),
-            "subscription_period": subscription_period,
-            "max_tip_amount": max_tip_amount,
-            "suggested_tip_amounts": json.dumps(suggested_tip_amounts) if suggested_tip_amounts is not None else None,
-            "provider_data": provider_data,
-            "photo_url": photo_url,
-            "photo_size": photo_size,
-            "photo_width": photo_width,
-            "photo_height": photo_height,
-            "need_name": need_name,
-            "need_phone_number": need_phone_number,
-            "need_email": need_email,
-            "need_shipping_address": need_shipping_address,
-            "send_phone_number_to_provider": send_phone_number_to_provider,
-            "send_email_to_provider": send_email_to_provider,
-            "is_flexible": is_flexible,
-        }
-
-        filtered_payload = {k: v for k, v in payload_data.items() if v is not None}
-        return self._make_request("createInvoiceLink", method="POST", data=filtered_payload)
+        payload_data = _pack(
+            business_connection_id=business_connection_id,
+            title=title,
+            description=description,
+            payload=payload,
+            provider_token=provider_token,
+            currency=currency,
+            prices=_dumps(prices),
+            subscription_period=subscription_period,
+            max_tip_amount=max_tip_amount,
+            suggested_tip_amounts=_dumps(suggested_tip_amounts) if suggested_tip_amounts is not None else None,
+            provider_data=provider_data,
+            photo_url=photo_url,
+            photo_size=photo_size,
+            photo_width=photo_width,
+            photo_height=photo_height,
+            need_name=need_name,
+            need_phone_number=need_phone_number,
+            need_email=need_email,
+            need_shipping_address=need_shipping_address,
+            send_phone_number_to_provider=send_phone_number_to_provider,
+            send_email_to_provider=send_email_to_provider,
+            is_flexible=is_flexible,
+        )
+        return self._make_request("createInvoiceLink", method="POST", data=payload_data)
 
     def answer_shipping_query(
         self,
@@ -5642,15 +5728,13 @@ class Telegram:
         if not ok and not error_message:
             raise ValueError("error_message is required when ok is False.")
 
-        payload = {
-            "shipping_query_id": shipping_query_id,
-            "ok": ok,
-            "shipping_options": json.dumps(shipping_options) if shipping_options is not None else None,
-            "error_message": error_message,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("answerShippingQuery", method="POST", data=filtered_payload)
+        payload = _pack(
+            shipping_query_id=shipping_query_id,
+            ok=ok,
+            shipping_options=_dumps(shipping_options) if shipping_options is not None else None,
+            error_message=error_message,
+        )
+        return self._make_request("answerShippingQuery", method="POST", data=payload)
 
     def answer_pre_checkout_query(
         self,
@@ -5675,14 +5759,12 @@ class Telegram:
         if not ok and not error_message:
             raise ValueError("error_message is required when ok is False.")
 
-        payload = {
-            "pre_checkout_query_id": pre_checkout_query_id,
-            "ok": ok,
-            "error_message": error_message,
-        }
-
-        filtered_payload = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("answerPreCheckoutQuery", method="POST", data=filtered_payload)
+        payload = _pack(
+            pre_checkout_query_id=pre_checkout_query_id,
+            ok=ok,
+            error_message=error_message,
+        )
+        return self._make_request("answerPreCheckoutQuery", method="POST", data=payload)
 
     def get_my_star_balance(self) -> Dict[Any, Any]:
         """
@@ -5710,13 +5792,11 @@ class Telegram:
         :param limit: Maximum number of transactions to retrieve (1–100). Defaults to 100.
         :return: A StarTransactions object on success.
         """
-        payload = {
-            "offset": offset,
-            "limit": limit,
-        }
-
-        filtered_params = {k: v for k, v in payload.items() if v is not None}
-        return self._make_request("getStarTransactions", method="GET", params=filtered_params)
+        payload = _pack(
+            offset=offset,
+            limit=limit,
+        )
+        return self._make_request("getStarTransactions", method="GET", params=payload)
 
     def refund_star_payment(
         self,
@@ -5732,10 +5812,10 @@ class Telegram:
         :param telegram_payment_charge_id: Telegram payment identifier (from SuccessfulPayment.telegram_payment_charge_id).
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "telegram_payment_charge_id": telegram_payment_charge_id,
-        }
+        payload = _pack(
+            user_id=user_id,
+            telegram_payment_charge_id=telegram_payment_charge_id,
+        )
         return self._make_request("refundStarPayment", method="POST", data=payload)
 
     def edit_user_star_subscription(
@@ -5756,11 +5836,11 @@ class Telegram:
                             Pass False to allow the user to re-enable a subscription previously canceled by the bot.
         :return: True on success.
         """
-        payload = {
-            "user_id": user_id,
-            "telegram_payment_charge_id": telegram_payment_charge_id,
-            "is_canceled": is_canceled,
-        }
+        payload = _pack(
+            user_id=user_id,
+            telegram_payment_charge_id=telegram_payment_charge_id,
+            is_canceled=is_canceled,
+        )
         return self._make_request("editUserStarSubscription", method="POST", data=payload)
 
 def create_shipping_query(
@@ -6222,10 +6302,10 @@ def set_passport_data_errors(
     :param errors: A list of PassportElementError objects describing the errors.
     :return: True on success.
     """
-    payload = {
-        "user_id": user_id,
-        "errors": json.dumps(errors),
-    }
+    payload = _pack(
+        user_id=user_id,
+        errors=_dumps(errors),
+    )
     return self._make_request("setPassportDataErrors", method="POST", data=payload)
 
 def create_passport_element_error_data_field(
@@ -6310,21 +6390,19 @@ def send_game(
                          The first button must be a game launch button if reply_markup is provided.
     :return: The sent Message object on success.
     """
-    payload = {
-        "chat_id": chat_id,
-        "business_connection_id": business_connection_id,
-        "message_thread_id": message_thread_id,
-        "game_short_name": game_short_name,
-        "disable_notification": disable_notification,
-        "protect_content": protect_content,
-        "allow_paid_broadcast": allow_paid_broadcast,
-        "message_effect_id": message_effect_id,
-        "reply_parameters": reply_parameters,
-        "reply_markup": reply_markup,
-    }
-
-    filtered_payload = {k: v for k, v in payload.items() if v is not None}
-    return self._make_request("sendGame", method="POST", data=filtered_payload)
+    payload = _pack(
+        chat_id=chat_id,
+        business_connection_id=business_connection_id,
+        message_thread_id=message_thread_id,
+        game_short_name=game_short_name,
+        disable_notification=disable_notification,
+        protect_content=protect_content,
+        allow_paid_broadcast=allow_paid_broadcast,
+        message_effect_id=message_effect_id,
+        reply_parameters=reply_parameters,
+        reply_markup=reply_markup,
+    )
+    return self._make_request("sendGame", method="POST", data=payload)
 
 def create_game(
     title: str,
@@ -6402,18 +6480,16 @@ def set_game_score(
     if not (chat_id and message_id) and not inline_message_id:
         raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-    payload = {
-        "user_id": user_id,
-        "score": score,
-        "force": force,
-        "disable_edit_message": disable_edit_message,
-        "chat_id": chat_id,
-        "message_id": message_id,
-        "inline_message_id": inline_message_id,
-    }
-
-    filtered_payload = {k: v for k, v in payload.items() if v is not None}
-    return self._make_request("setGameScore", method="POST", data=filtered_payload)
+    payload = _pack(
+        user_id=user_id,
+        score=score,
+        force=force,
+        disable_edit_message=disable_edit_message,
+        chat_id=chat_id,
+        message_id=message_id,
+        inline_message_id=inline_message_id,
+    )
+    return self._make_request("setGameScore", method="POST", data=payload)
 
 def get_game_high_scores(
     self,
@@ -6441,15 +6517,13 @@ def get_game_high_scores(
     if not (chat_id and message_id) and not inline_message_id:
         raise ValueError("Either (chat_id and message_id) or inline_message_id must be provided.")
 
-    payload = {
-        "user_id": user_id,
-        "chat_id": chat_id,
-        "message_id": message_id,
-        "inline_message_id": inline_message_id,
-    }
-
-    filtered_params = {k: v for k, v in payload.items() if v is not None}
-    return self._make_request("getGameHighScores", method="GET", params=filtered_params)
+    payload = _pack(
+        user_id=user_id,
+        chat_id=chat_id,
+        message_id=message_id,
+        inline_message_id=inline_message_id,
+    )
+    return self._make_request("getGameHighScores", method="GET", params=payload)
 
 def create_game_high_score(
     position: int,
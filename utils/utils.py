@@ -4,14 +4,24 @@ import secrets
 def update_object(obj, **kwargs) -> None:
     """
     Update object attributes in the database.
+    Fields that already hold the given value are skipped, and nothing is
+    written when none changed. The instance is kept in sync with the row.
     """
-    if kwargs:
-        obj.__class__.objects.filter(pk=obj.pk).update(**kwargs)
+    deferred = obj.get_deferred_fields()
+    changed = {k: v for k, v in kwargs.items() if k in deferred or getattr(obj, k) != v}
+    if changed:
+        obj.__class__.objects.filter(pk=obj.pk).update(**changed)
+        for k, v in changed.items():
+            setattr(obj, k, v)
 
 def generate_unique_link(prefix: str, char_size: int = 10) -> str:
     """
     Generate a short unique link with given prefix.
     Example: S_a8df9K2L or E_xc91UzpQ
+
+    No lookup is made to check for collisions: with `char_size` random bytes
+    a clash is practically impossible and the `unique=True` constraint on the
+    link columns still guards against it.
     """
-    token = secrets.token_urlsafe(char_size)  # random 8-10 chars
+    token = secrets.token_urlsafe(char_size)  # char_size random bytes, ~1.3x chars
     return f"{prefix}_{token}"